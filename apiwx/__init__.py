@@ -146,6 +146,7 @@ try:
         uicritical_log,
         uidebug_set_level,
         uidebug_get_level,
+        uilog_enabled,
         uilog_output_remaining,
         internallog,
         internaldebug_log,
@@ -155,6 +156,7 @@ try:
         internalcritical_log,
         internal_set_level,
         internal_get_level,
+        internallog_enabled,
         internallog_output_remaining,
     )
 
@@ -170,6 +172,7 @@ except ImportError:
         uicritical_log,
         uidebug_set_level,
         uidebug_get_level,
+        uilog_enabled,
         uilog_output_remaining,
         internallog,
         internaldebug_log,
@@ -179,6 +182,7 @@ except ImportError:
         internalcritical_log,
         internal_set_level,
         internal_get_level,
+        internallog_enabled,
         internallog_output_remaining,
     )
 
@@ -510,7 +514,7 @@ __all__ = [
     # Debug & Logging Functions
     "Logger", "LogLevel", "uilog", "uidebug_log", "uiinfo_log", 
     "uiwarning_log", "uierror_log", "uicritical_log", "uidebug_set_level", 
-    "uidebug_get_level", "uilog_output_remaining",
+    "uidebug_get_level", "uilog_enabled", "uilog_output_remaining",
 
     # Event Control Classes
     "EventControl",
@@ -474,6 +474,11 @@ def uidebug_get_level() -> LogLevel:
     return LogLevel.DEBUG
 
 
+def uilog_enabled(level: LogLevel = LogLevel.INFO) -> bool:
+    """Check if UI debug logger outputs messages of the given level"""
+    return uidebug is not None and level >= uidebug._log_level
+
+
 def uilog_output_remaining():
     remain_logger_output(uidebug)
 
@@ -523,6 +528,11 @@ def internal_get_level() -> LogLevel:
     return LogLevel.DEBUG
 
 
+def internallog_enabled(level: LogLevel = LogLevel.DEBUG) -> bool:
+    """Check if internal logger outputs messages of the given level"""
+    return internal is not None and level >= internal._log_level
+
+
 def internallog_output_remaining():
     remain_logger_output(internal)
 
@@ -545,6 +555,7 @@ __all__ = [
     'uicritical_log',
     'uidebug_set_level',
     'uidebug_get_level',
+    'uilog_enabled',
     'uilog_output_remaining',
     
     # Internal logging functions
@@ -556,6 +567,7 @@ __all__ = [
     'internalcritical_log',
     'internal_set_level',
     'internal_get_level',
+    'internallog_enabled',
     'internallog_output_remaining',
     
     # Logger instances
@@ -15,6 +15,8 @@ Key features:
 The module is designed to simplify font handling in wxPython applications
 by providing a consistent interface for font creation, storage, and retrieval.
 """
+import functools
+import sys
 import typing
 
 from wx import (
@@ -29,7 +31,26 @@ from wx import (
 )
 
 
-class FontManager(dict[str, _Font]):
+@functools.lru_cache(maxsize=256)
+def _make_key(
+        size: int,
+        weight: int = FONTWEIGHT_NORMAL,
+        style: int = FONTSTYLE_NORMAL,
+        underline: bool = False,
+        strikethrough: bool = False) -> str:
+    """Build the font key name for the given parameters.
+
+    Results are memoized, so repeated requests for the same font only
+    cost a cache lookup instead of a new string build. Keys are interned,
+    so a key rebuilt after falling out of the cache is still the same
+    object as the one stored in the manager.
+    """
+    return sys.intern(
+        f"{size}_{weight}_{style}_{int(underline)}_{int(strikethrough)}"
+    )
+
+
+class FontManager:
     """Singleton font manager for wxPython applications.
 
     FontManager provides centralized font creation and management using a
@@ -38,8 +59,9 @@ class FontManager(dict[str, _Font]):
     Fonts are stored with automatically generated key names based on their
     properties, enabling efficient reuse and management.
 
-    The class extends dict[str, wx.Font] and provides multiple creation 
-    methods:
+    Fonts are held in a plain dict[str, wx.Font] and the manager exposes
+    read-only mapping access (``in``, ``len``, iteration, ``keys``,
+    ``values``, ``items``, ``get``) plus multiple creation methods:
     - Parameter-based creation with automatic key generation
     - Key name-based creation for explicit font specification
     - Static methods for convenient access without instance management
@@ -48,7 +70,12 @@ class FontManager(dict[str, _Font]):
 
     Attributes:
         instance: Class variable holding the singleton instance.
-        font_family: Default font family name for all created fonts.
+        font_family: Font family name for newly created fonts. Passing a
+            family to FontManager() changes it for fonts created
+            afterwards, fonts already stored keep their family.
+        _fonts: Font storage, key name to wx.Font.
+        _font_to_key: Reverse index from ``id()`` of a managed font to its
+            key name.
 
     Example:
         >>> # Initialize with default font family
@@ -68,6 +95,7 @@ class FontManager(dict[str, _Font]):
         >>> button.SetFont(font)
     """
     instance: typing.Type['FontManager'] | None = None
+    font_family: str = "MS UI Gothic"
 
 
     def __new__(cls, *args, **kwargs):
@@ -77,11 +105,34 @@ class FontManager(dict[str, _Font]):
         return FontManager.instance
 
 
-    def __init__(self, font_family: str = "MS UI Gothic"):
-        # Init base dict class
-        super().__init__()
-        # Set font family
-        self.font_family = font_family
+    def __init__(self, font_family: str | None = None):
+        # FontManager() returns the singleton, so __init__ runs again on
+        # every call. Only set up the storage once, otherwise the fonts
+        # and the reverse index would be reset.
+        if not self.__dict__.get('_initialized', False):
+            # Font storage
+            self._fonts: dict[str, _Font] = {}
+            # Reverse index for getkey_from_font
+            self._font_to_key: dict[int, str] = {}
+
+            self._initialized = True
+
+        # An explicit font family applies to fonts created from now on,
+        # also on later calls. Only shadow the class default when it
+        # differs.
+        if font_family is not None and font_family != self.font_family:
+            self.font_family = font_family
+
+
+    @staticmethod
+    def _manager() -> 'FontManager':
+        """Return the singleton instance, creating it on first use."""
+        manager = FontManager.instance
+
+        if manager is None:
+            manager = FontManager()
+
+        return manager
 
 
     def create_by_parameter(
@@ -95,7 +146,8 @@ class FontManager(dict[str, _Font]):
 
         This method creates a new font using the provided parameters and stores
         it in the manager with an automatically generated key name. If a font
-        with the same parameters already exists, it will be overwritten.
+        with the same parameters already exists, it is reused and no new
+        wx.Font is constructed.
 
         Args:
             size: Font size in points.
@@ -118,6 +170,13 @@ class FontManager(dict[str, _Font]):
             ...     12, style=FONTSTYLE_ITALIC)  # Italic font
         """
 
+        # Create key name
+        keyname = _make_key(size, weight, style, underline, strikethrough)
+
+        # Font already exists
+        if keyname in self._fonts:
+            return keyname
+
         # Create font info
         fontinfo = _FontInfo(size)
         fontinfo.FaceName(self.font_family)
@@ -129,13 +188,9 @@ class FontManager(dict[str, _Font]):
         # Create font
         font = _Font(fontinfo)
 
-        # Create key name
-        keyname = (
-            f"{size}_{weight}_{style}_{int(underline)}_{int(strikethrough)}"
-        )
-
         # Add to manager
-        self[keyname] = font
+        self._fonts[keyname] = font
+        self._font_to_key[id(font)] = keyname
 
         # Return key name
         return keyname
@@ -147,7 +202,8 @@ class FontManager(dict[str, _Font]):
 
         This method parses a key name in the format 
         ``{size}_{weight}_{style}_{underline}_{strikethrough}`` and creates
-        a corresponding font. The created font is stored in the manager.
+        a corresponding font. The created font is stored in the manager; an
+        existing font with the same key name is reused.
 
         Args:
             keyname: Key name string in the format 
@@ -169,25 +225,27 @@ class FontManager(dict[str, _Font]):
             >>> key = mgr.create_by_keyname("12_400_1_0_0")  # Italic font
         """
 
-        # Split key name
-        params = keyname.split("_")
-
-        if len(params) != 5:
-            raise ValueError("Invalid key name format")
+        # Font already exists
+        if keyname in self._fonts:
+            return keyname
 
         try:
-            size = int(params[0])
-            weight = int(params[1])
-            style = int(params[2])
-            underline = bool(int(params[3]))
-            strikethrough = bool(int(params[4]))
-
-        except Exception as e:
+            # Split key name, unpacking validates the field count
+            size, weight, style, underline, strikethrough = (
+                keyname.split("_")
+            )
+            params = (
+                int(size),
+                int(weight),
+                int(style),
+                bool(int(underline)),
+                bool(int(strikethrough))
+            )
+
+        except ValueError as e:
             raise ValueError("Invalid key name format") from e
 
-        return self.create_by_parameter(
-            size, weight, style, underline, strikethrough
-        )
+        return self.create_by_parameter(*params)
 
 
     def create(self, *args):
@@ -233,7 +291,7 @@ class FontManager(dict[str, _Font]):
     def __getitem__(self, arg: str | tuple[int, ...]) -> _Font:
         """Retrieve or create a font using flexible key patterns.
 
-        This method overrides the dictionary's __getitem__ to support both
+        This method provides subscript access and supports both
         string keys and parameter-based access. If the requested font does not
         exist, it will be automatically created and added to the manager.
 
@@ -264,23 +322,54 @@ class FontManager(dict[str, _Font]):
             key = arg
 
         elif isinstance(arg, tuple):
-            key = self.parameter_to_keyname(*arg)
+            key = _make_key(*arg)
 
         else:
             raise ValueError("Invalid arguments")
 
+        font = self._fonts.get(key)
+
         # If font not exist
-        if key not in self:
+        if font is None:
             # Create font if not exist
             self.create_by_keyname(key)
+            font = self._fonts[key]
 
         # Return font
-        return super().__getitem__(key)
+        return font
+
+
+    def __contains__(self, keyname: object) -> bool:
+        return keyname in self._fonts
+
+
+    def __len__(self) -> int:
+        return len(self._fonts)
+
+
+    def __iter__(self) -> typing.Iterator[str]:
+        return iter(self._fonts)
+
+
+    def keys(self) -> typing.KeysView[str]:
+        return self._fonts.keys()
+
+
+    def values(self) -> typing.ValuesView[_Font]:
+        return self._fonts.values()
+
+
+    def items(self) -> typing.ItemsView[str, _Font]:
+        return self._fonts.items()
+
+
+    def get(self, keyname: str, default: _Font | None = None) -> _Font | None:
+        """Return the stored font for keyname without creating it."""
+        return self._fonts.get(keyname, default)
     
 
-    @classmethod
+    @staticmethod
     def parameter_to_keyname(
-        cls,
         size: int,
         weight: int = FONTWEIGHT_NORMAL,
         style: int = FONTSTYLE_NORMAL,
@@ -288,7 +377,7 @@ class FontManager(dict[str, _Font]):
         strikethrough: bool = False) -> str:
         """Convert font parameters to a standardized key name string.
 
-        This class method generates a standardized key name string from font
+        This static method generates a standardized key name string from font
         parameters without creating an actual font object. The generated key
         can be used for font identification and storage.
 
@@ -317,7 +406,7 @@ class FontManager(dict[str, _Font]):
             >>> print(key)  # "12_400_1_0_0"
         """
 
-        return f"{size}_{weight}_{style}_{int(underline)}_{int(strikethrough)}"
+        return _make_key(size, weight, style, underline, strikethrough)
 
 
     @staticmethod
@@ -366,7 +455,7 @@ class FontManager(dict[str, _Font]):
             >>> key = FontManager.create_font("12_400_0_0_0")
         """
 
-        return FontManager().create(*args)
+        return FontManager._manager().create(*args)
 
 
     @staticmethod
@@ -385,7 +474,7 @@ class FontManager(dict[str, _Font]):
 
 
     @staticmethod
-    def get_font(arg) -> _Font:
+    def get_font(*args, **kwds) -> _Font:
         """Retrieve a font from the singleton FontManager instance.
 
         This static method provides a convenient way to access fonts without
@@ -398,9 +487,11 @@ class FontManager(dict[str, _Font]):
             *args: Variable arguments that can be either
                 - A single string: key name in format 
                   ``{size}_{weight}_{style}_{underline}_{strikethrough}``
+                - A single tuple of the parameters below
                 - Multiple parameters: size (int), weight (int, optional), 
                   style (int, optional), underline (bool, optional), 
                   strikethrough (bool, optional)
+            **kwds: Keyword form of the font parameters.
 
         Returns:
             The wx.Font object corresponding to the specified parameters or 
@@ -419,15 +510,40 @@ class FontManager(dict[str, _Font]):
             >>> label.SetFont(font)
         """
 
-        return FontManager()[arg]
+        manager = FontManager._manager()
+
+        if len(args) == 1 and not kwds:
+            arg = args[0]
+
+            if isinstance(arg, str):
+                key = arg
+
+            elif isinstance(arg, tuple):
+                key = _make_key(*arg)
+
+            else:
+                key = _make_key(arg)
+
+        else:
+            key = _make_key(*args, **kwds)
+
+        # Look up the stored font directly, skipping __getitem__ dispatch.
+        fonts = manager._fonts
+        font = fonts.get(key)
+
+        if font is None:
+            manager.create_by_keyname(key)
+            font = fonts[key]
+
+        return font
 
 
     @classmethod
     def getkey_from_font(cls, font: _Font) -> str:
         """Extract or generate a key name from a wx.Font object.
 
-        This class method searches the FontManager for an existing font that
-        matches the provided font object. If found, it returns the 
+        This class method looks up the provided font object in the
+        FontManager's reverse index. If it is a managed font, it returns the
         corresponding key name. If not found, it generates a key name based on 
         the font's properties without adding the font to the manager.
 
@@ -451,16 +567,18 @@ class FontManager(dict[str, _Font]):
             >>> print(key)  # "12_400_0_0_0"
         """
 
-        for key, value in cls().items():
-            if value == font:
-                return key
+        key = FontManager._manager()._font_to_key.get(id(font))
 
-        key = (
-            f"{font.GetPointSize()}_{font.GetWeight()}_{font.GetStyle()}_"
-            f"{int(font.GetUnderlined())}_{int(font.GetStrikethrough())}"
-        )
+        if key is not None:
+            return key
 
-        return key
+        return _make_key(
+            font.GetPointSize(),
+            font.GetWeight(),
+            font.GetStyle(),
+            font.GetUnderlined(),
+            font.GetStrikethrough()
+        )
 
 
 __all__ = [
@@ -32,28 +32,47 @@ Note:
     same values and behavior as their original wxPython counterparts.
 """
 
-from wx import (
+# Names re-exported from wx. They are resolved on first access through
+# the module __getattr__ below (PEP 562), so importing this module does
+# not import wx by itself.
+_WX_NAMES = frozenset((
     # Window border styles (from wx/window.h)
-    SIMPLE_BORDER,
-    SUNKEN_BORDER,
-    RAISED_BORDER,
-    NO_BORDER,
-    
+    'SIMPLE_BORDER',
+    'SUNKEN_BORDER',
+    'RAISED_BORDER',
+    'NO_BORDER',
+
     # Window behavior styles (from wx/window.h)
-    TAB_TRAVERSAL,
-    WANTS_CHARS,
-    
+    'TAB_TRAVERSAL',
+    'WANTS_CHARS',
+
     # Scrolling styles (from wx/window.h)
-    VSCROLL,
-    HSCROLL,
-    
+    'VSCROLL',
+    'HSCROLL',
+
     # Extended window styles (from wxWindow::SetExtraStyle)
-    WS_EX_VALIDATE_RECURSIVELY,
-    WS_EX_BLOCK_EVENTS,
-    WS_EX_TRANSIENT,
-    WS_EX_PROCESS_IDLE,
-    WS_EX_PROCESS_UI_UPDATES,
-)
+    'WS_EX_VALIDATE_RECURSIVELY',
+    'WS_EX_BLOCK_EVENTS',
+    'WS_EX_TRANSIENT',
+    'WS_EX_PROCESS_IDLE',
+    'WS_EX_PROCESS_UI_UPDATES',
+))
+
+
+def __getattr__(name: str):
+    if name in _WX_NAMES:
+        import wx
+
+        value = getattr(wx, name)
+        # Cache in the module namespace, later lookups skip __getattr__.
+        globals()[name] = value
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _WX_NAMES)
 
 
 __all__ = [
@@ -19,7 +19,10 @@ Classes:
     ProgressMessageBox: Progress dialogs for long operations
     InputDialog: Input dialogs for user data entry
 """
+import time
+import weakref
 import wx
+import wx.siplib as sip
 from typing import Optional, Union, Tuple, Any
 from enum import Enum, auto
 
@@ -60,220 +63,353 @@ class MessageResult(Enum):
     UNKNOWN = -1
 
 
-class MessageBox:
-    """Enhanced message box wrapper for wxPython.
+# Weak reference to the last resolved top-level parent window.
+_cached_top: Optional['weakref.ref[wx.Window]'] = None
 
-    This class provides a simplified interface for displaying various types
-    of message dialogs with consistent styling and error handling. All methods
-    are static and can be called without instantiating the class.
+# wx result codes to MessageResult, avoids Enum lookup and ValueError.
+_WX_TO_RESULT = {result.value: result for result in MessageResult}
 
-    The class automatically handles parent window detection and provides
-    comprehensive logging of all message box operations.
+# Bound lookup for wx result codes, None for unknown codes.
+_resolve_result = _WX_TO_RESULT.get
 
-    Example:
-        >>> # Simple info message
-        >>> MessageBox.info("Operation completed successfully!")
-        >>> 
-        >>> # Yes/No question
-        >>> result = MessageBox.question("Do you want to save changes?")
-        >>> if result == MessageResult.YES:
-        ...     save_changes()
+# Reusable message dialogs keyed by (id(parent), style).
+_dialog_pool: dict[tuple[int, int], wx.MessageDialog] = {}
+
+# Minimum seconds between progress update log records.
+_PROGRESS_LOG_INTERVAL = 0.1
+
+# wx style flags for each message type, built once at import.
+_DEFAULT_STYLE = wx.ICON_INFORMATION | wx.OK
+
+_TYPE_STYLES = {
+    MessageType.INFO: wx.ICON_INFORMATION | wx.OK,
+    MessageType.WARNING: wx.ICON_WARNING | wx.OK,
+    MessageType.ERROR: wx.ICON_ERROR | wx.OK,
+    MessageType.QUESTION: wx.ICON_QUESTION | wx.YES_NO,
+    MessageType.SUCCESS: wx.ICON_INFORMATION | wx.OK,
+}
+
+
+# Module-level implementations, MessageBox exposes them as static methods.
+def _forget_top(event: wx.Event) -> None:
+    """Drop the cached parent window when it is closed or destroyed."""
+    global _cached_top
+
+    _cached_top = None
+    event.Skip()
+
+
+def _forget_hidden_top(event: wx.ShowEvent) -> None:
+    """Drop the cached parent window when it is hidden."""
+    global _cached_top
+
+    if not event.IsShown():
+        _cached_top = None
+
+    event.Skip()
+
+
+def _get_parent() -> Optional[wx.Window]:
+    """Get the best parent window for the message box.
+
+    The resolved top window is cached through a weak reference and
+    reused while it is alive and shown, so repeated dialogs skip the
+    wx.GetApp().GetTopWindow() round-trip. Closing, destroying or
+    hiding the window drops the cache.
     """
+    global _cached_top
 
-    @staticmethod
-    def _get_parent() -> Optional[wx.Window]:
-        """Get the best parent window for the message box"""
-        try:
-            app = wx.GetApp()
+    if _cached_top is not None:
+        top_window = _cached_top()
 
-            if app:
-                top_window = app.GetTopWindow()
+        if (top_window is not None
+                and not sip.isdeleted(top_window)
+                and top_window.IsShown()):
+            return top_window
 
-            if top_window:
-                return top_window
-            
-        except:
-            pass
+        _cached_top = None
 
-        return None
+    try:
+        app = wx.GetApp()
 
-    @staticmethod
-    def _get_style_for_type(msg_type: MessageType) -> int:
-        """Get wx style flags for message type"""
-        styles = {
-            MessageType.INFO: wx.ICON_INFORMATION | wx.OK,
-            MessageType.WARNING: wx.ICON_WARNING | wx.OK,
-            MessageType.ERROR: wx.ICON_ERROR | wx.OK,
-            MessageType.QUESTION: wx.ICON_QUESTION | wx.YES_NO,
-            MessageType.SUCCESS: wx.ICON_INFORMATION | wx.OK,
-        }
-
-        return styles.get(msg_type, wx.ICON_INFORMATION | wx.OK)
+        if not app:
+            return None
 
-    @staticmethod
-    def _show_message(
-            message: str,
-            title: str = "Message",
-            style: int = wx.OK | wx.ICON_INFORMATION,
-            parent: Optional[wx.Window] = None
-        ) -> MessageResult:
-        """Core message box display function"""
-        if parent is None:
-            parent = MessageBox._get_parent()
+        top_window = app.GetTopWindow()
 
-        try:
-            dlg = wx.MessageDialog(parent, message, title, style)
-            result = dlg.ShowModal()
+        if top_window:
+            # Unbind first, the same window may be cached again.
+            for event_type, handler in (
+                    (wx.EVT_CLOSE, _forget_top),
+                    (wx.EVT_WINDOW_DESTROY, _forget_top),
+                    (wx.EVT_SHOW, _forget_hidden_top)):
+                top_window.Unbind(event_type, handler=handler)
+                top_window.Bind(event_type, handler)
+
+            _cached_top = weakref.ref(top_window)
+            return top_window
+        
+    except:
+        pass
+
+    return None
+
+
+def _get_style_for_type(msg_type: MessageType) -> int:
+    """Get wx style flags for message type"""
+    return _TYPE_STYLES.get(msg_type, _DEFAULT_STYLE)
+
+
+def _acquire_dialog(
+        parent: Optional[wx.Window],
+        message: str,
+        title: str,
+        style: int
+    ) -> tuple[wx.MessageDialog, bool]:
+    """Get a message dialog for parent and style, reusing a pooled one.
+
+    Only dialogs with a parent are pooled. They are destroyed together
+    with their parent, and a parentless hidden dialog would keep the
+    application alive. Pooled dialogs whose wx object is gone are
+    replaced. A pooled dialog that is still open (a message shown from
+    an event handler or timer while it is modal) is left alone and a
+    one-off dialog is created instead.
+
+    Returns:
+        tuple[wx.MessageDialog, bool]: The dialog, and whether it is
+        pooled. Dialogs that are not pooled must be destroyed after use.
+    """
+    if parent is None:
+        return wx.MessageDialog(parent, message, title, style), False
+
+    key = (id(parent), style)
+    dlg = _dialog_pool.get(key)
+
+    if (dlg is not None and not sip.isdeleted(dlg)
+            and dlg.GetParent() is parent):
+        if dlg.IsModal():
+            # Busy, do not change or reshow the open dialog.
+            return wx.MessageDialog(parent, message, title, style), False
+
+        dlg.SetMessage(message)
+        dlg.SetTitle(title)
+
+        return dlg, True
+
+    # Drop dialogs destroyed with their parents.
+    for stale_key in [key for key, pooled in _dialog_pool.items()
+                      if sip.isdeleted(pooled)]:
+        del _dialog_pool[stale_key]
+
+    dlg = wx.MessageDialog(parent, message, title, style)
+    _dialog_pool[key] = dlg
+
+    return dlg, True
+
+
+def _show_message(
+        message: str,
+        title: str = "Message",
+        style: int = wx.OK | wx.ICON_INFORMATION,
+        parent: Optional[wx.Window] = None
+    ) -> MessageResult:
+    """Core message box display function"""
+    if parent is None:
+        parent = _get_parent()
+
+    try:
+        dlg, pooled = _acquire_dialog(parent, message, title, style)
+        result = dlg.ShowModal()
+
+        # Pooled dialogs are kept for the next call.
+        if not pooled:
             dlg.Destroy()
 
-            # Convert wx result to our enum
-            try:
-                return MessageResult(result)
-            
-            except ValueError:
-                debug.uilog("MESSAGE", f"Unknown result code: {result}",
-                           LogLevel.WARNING)
+        # Convert wx result to our enum
+        message_result = _resolve_result(result)
+
+        if message_result is None:
+            debug.uilog("MESSAGE", f"Unknown result code: {result}",
+                       LogLevel.WARNING)
 
             return MessageResult.UNKNOWN
 
-        except Exception as e:
-            debug.uilog("MESSAGE", f"Error showing message: {e}",
-                       LogLevel.ERROR)
+        return message_result
 
-            return MessageResult.UNKNOWN
+    except Exception as e:
+        debug.uilog("MESSAGE", f"Error showing message: {e}",
+                   LogLevel.ERROR)
 
-    @staticmethod
-    def info(
-            message: str,
-            title: str = "Information",
-            parent: Optional[wx.Window] = None
-        ) -> MessageResult:
-        """Show information message.
+        return MessageResult.UNKNOWN
+
+
+def _info(
+        message: str,
+        title: str = "Information",
+        parent: Optional[wx.Window] = None
+    ) -> MessageResult:
+    """Show information message.
+    
+    Args:
+        message (str): The message text to display.
+        title (str): The dialog title. Defaults to "Information".
+        parent (Optional[wx.Window]): Parent window or None for auto.
         
-        Args:
-            message (str): The message text to display.
-            title (str): The dialog title. Defaults to "Information".
-            parent (Optional[wx.Window]): Parent window or None for auto.
-            
-        Returns:
-            MessageResult: The user's response (typically OK).
-        """
+    Returns:
+        MessageResult: The user's response (typically OK).
+    """
 
+    if debug.uilog_enabled(LogLevel.INFO):
         debug.uilog("MESSAGE", f"Info: {title} - {message[:50]}...",
                    LogLevel.INFO)
-        
-        return MessageBox._show_message(
-            message,
-            title,
-            wx.OK | wx.ICON_INFORMATION,
-            parent
-        )
+    
+    return _show_message(
+        message,
+        title,
+        wx.OK | wx.ICON_INFORMATION,
+        parent
+    )
 
-    @staticmethod
-    def warning(
-            message: str,
-            title: str = "Warning",
-            parent: Optional[wx.Window] = None
-        ) -> MessageResult:
-        """Show warning message.
+
+def _warning(
+        message: str,
+        title: str = "Warning",
+        parent: Optional[wx.Window] = None
+    ) -> MessageResult:
+    """Show warning message.
+    
+    Args:
+        message (str): The warning message text to display.
+        title (str): The dialog title. Defaults to "Warning".
+        parent (Optional[wx.Window]): Parent window or None for auto.
         
-        Args:
-            message (str): The warning message text to display.
-            title (str): The dialog title. Defaults to "Warning".
-            parent (Optional[wx.Window]): Parent window or None for auto.
-            
-        Returns:
-            MessageResult: The user's response (typically OK).
-        """
+    Returns:
+        MessageResult: The user's response (typically OK).
+    """
 
+    if debug.uilog_enabled(LogLevel.WARNING):
         debug.uilog("MESSAGE", f"Warning: {title} - {message[:50]}...",
                    LogLevel.WARNING)
 
-        return MessageBox._show_message(
-            message,
-            title,
-            wx.OK | wx.ICON_WARNING,
-            parent
-        )
+    return _show_message(
+        message,
+        title,
+        wx.OK | wx.ICON_WARNING,
+        parent
+    )
 
-    @staticmethod
-    def error(
-            message: str,
-            title: str = "Error",
-            parent: Optional[wx.Window] = None
-        ) -> MessageResult:
-        """Show error message.
+
+def _error(
+        message: str,
+        title: str = "Error",
+        parent: Optional[wx.Window] = None
+    ) -> MessageResult:
+    """Show error message.
+    
+    Args:
+        message (str): The error message text to display.
+        title (str): The dialog title. Defaults to "Error".
+        parent (Optional[wx.Window]): Parent window or None for auto.
         
-        Args:
-            message (str): The error message text to display.
-            title (str): The dialog title. Defaults to "Error".
-            parent (Optional[wx.Window]): Parent window or None for auto.
-            
-        Returns:
-            MessageResult: The user's response (typically OK).
-        """
+    Returns:
+        MessageResult: The user's response (typically OK).
+    """
 
+    if debug.uilog_enabled(LogLevel.ERROR):
         debug.uilog("MESSAGE", f"Error: {title} - {message[:50]}...",
                    LogLevel.ERROR)
 
-        return MessageBox._show_message(
-            message,
-            title,
-            wx.OK | wx.ICON_ERROR,
-            parent
-        )
+    return _show_message(
+        message,
+        title,
+        wx.OK | wx.ICON_ERROR,
+        parent
+    )
 
-    @staticmethod
-    def question(
-            message: str,
-            title: str = "Question",
-            parent: Optional[wx.Window] = None
-        ) -> MessageResult:
-        """Show yes/no question.
+
+def _question(
+        message: str,
+        title: str = "Question",
+        parent: Optional[wx.Window] = None
+    ) -> MessageResult:
+    """Show yes/no question.
+    
+    Args:
+        message (str): The question text to display.
+        title (str): The dialog title. Defaults to "Question".
+        parent (Optional[wx.Window]): Parent window or None for auto.
         
-        Args:
-            message (str): The question text to display.
-            title (str): The dialog title. Defaults to "Question".
-            parent (Optional[wx.Window]): Parent window or None for auto.
-            
-        Returns:
-            MessageResult: YES or NO based on user choice.
-        """
+    Returns:
+        MessageResult: YES or NO based on user choice.
+    """
 
+    if debug.uilog_enabled():
         debug.uilog("MESSAGE", f"Question: {title} - {message[:50]}...")
 
-        return MessageBox._show_message(
-            message,
-            title,
-            wx.YES_NO | wx.ICON_QUESTION,
-            parent
-        )
+    return _show_message(
+        message,
+        title,
+        wx.YES_NO | wx.ICON_QUESTION,
+        parent
+    )
 
-    @staticmethod
-    def success(
+
+def _success(
         message: str,
         title: str = "Success",
         parent: Optional[wx.Window] = None
     ) -> MessageResult:
-        """Show success message.
+    """Show success message.
+    
+    Args:
+        message (str): The success message text to display.
+        title (str): The dialog title. Defaults to "Success".
+        parent (Optional[wx.Window]): Parent window or None for auto.
         
-        Args:
-            message (str): The success message text to display.
-            title (str): The dialog title. Defaults to "Success".
-            parent (Optional[wx.Window]): Parent window or None for auto.
-            
-        Returns:
-            MessageResult: The user's response (typically OK).
-        """
+    Returns:
+        MessageResult: The user's response (typically OK).
+    """
 
+    if debug.uilog_enabled():
         debug.uilog("MESSAGE", f"Success: {title} - {message[:50]}...")
 
-        return MessageBox._show_message(
-            message,
-            title,
-            wx.OK | wx.ICON_INFORMATION,
-            parent
-        )
+    return _show_message(
+        message,
+        title,
+        wx.OK | wx.ICON_INFORMATION,
+        parent
+    )
+
+
+class MessageBox:
+    """Enhanced message box wrapper for wxPython.
+
+    This class provides a simplified interface for displaying various types
+    of message dialogs with consistent styling and error handling. All methods
+    are static and can be called without instantiating the class.
+
+    The class automatically handles parent window detection and provides
+    comprehensive logging of all message box operations.
+
+    Example:
+        >>> # Simple info message
+        >>> MessageBox.info("Operation completed successfully!")
+        >>> 
+        >>> # Yes/No question
+        >>> result = MessageBox.question("Do you want to save changes?")
+        >>> if result == MessageResult.YES:
+        ...     save_changes()
+    """
+
+    # Thin shims over the module-level implementations.
+    _get_parent = staticmethod(_get_parent)
+    _get_style_for_type = staticmethod(_get_style_for_type)
+    _show_message = staticmethod(_show_message)
+    info = staticmethod(_info)
+    warning = staticmethod(_warning)
+    error = staticmethod(_error)
+    question = staticmethod(_question)
+    success = staticmethod(_success)
 
 
 class MessageButtons(Enum):
@@ -289,6 +425,13 @@ class MessageButtons(Enum):
     CLOSE = wx.CLOSE
 
 
+# Extra style flags for CustomMessageBox default buttons.
+_DEFAULT_BUTTON_STYLES = {
+    MessageResult.NO: wx.NO_DEFAULT,
+    MessageResult.CANCEL: wx.CANCEL_DEFAULT,
+}
+
+
 class CustomMessageBox:
     """Advanced message box with full customization.
 
@@ -305,6 +448,10 @@ class CustomMessageBox:
         ...     default_button=MessageResult.NO
         ... ).show()
     """
+    __slots__ = (
+        "message", "title", "_buttons", "_icon", "_default_button", "parent",
+        "_style",
+    )
 
     def __init__(
             self,
@@ -327,11 +474,52 @@ class CustomMessageBox:
         """
         self.message = message
         self.title = title
-        self.buttons = (buttons.value if isinstance(buttons, MessageButtons)
-                       else buttons)
-        self.icon = icon
-        self.default_button = default_button
-        self.parent = parent or MessageBox._get_parent()
+        self._buttons = (buttons.value if isinstance(buttons, MessageButtons)
+                        else buttons)
+        self._icon = icon
+        self._default_button = default_button
+        # Resolved in show(), the top window may change before then.
+        self.parent = parent
+
+        self._update_style()
+
+    @property
+    def buttons(self) -> int:
+        """wx button style flags."""
+        return self._buttons
+
+    @buttons.setter
+    def buttons(self, buttons: Union[MessageButtons, int]) -> None:
+        self._buttons = (buttons.value if isinstance(buttons, MessageButtons)
+                        else buttons)
+        self._update_style()
+
+    @property
+    def icon(self) -> int:
+        """wx icon style flags."""
+        return self._icon
+
+    @icon.setter
+    def icon(self, icon: int) -> None:
+        self._icon = icon
+        self._update_style()
+
+    @property
+    def default_button(self) -> Optional[MessageResult]:
+        """Button selected by default, or None for the wx default."""
+        return self._default_button
+
+    @default_button.setter
+    def default_button(self, default_button: Optional[MessageResult]) -> None:
+        self._default_button = default_button
+        self._update_style()
+
+    def _update_style(self) -> None:
+        """Recompute the style flags used by show()."""
+        self._style = (
+            self._buttons | self._icon
+            | _DEFAULT_BUTTON_STYLES.get(self._default_button, 0)
+        )
 
     def show(self) -> MessageResult:
         """Show the custom message box.
@@ -339,23 +527,14 @@ class CustomMessageBox:
         Returns:
             MessageResult: The user's response based on button clicked.
         """
-        style = self.buttons | self.icon
+        if debug.uilog_enabled():
+            debug.uilog("MESSAGE",
+                       f"Custom: {self.title} - {self.message[:50]}...")
 
-        # Set default button if specified
-        if self.default_button:
-            if self.default_button == MessageResult.NO:
-                style |= wx.NO_DEFAULT
-
-            elif self.default_button == MessageResult.CANCEL:
-                style |= wx.CANCEL_DEFAULT
-
-        debug.uilog("MESSAGE",
-                   f"Custom: {self.title} - {self.message[:50]}...")
-
-        return MessageBox._show_message(
+        return _show_message(
             self.message,
             self.title,
-            style,
+            self._style,
             self.parent
         )
 
@@ -376,6 +555,9 @@ class ProgressMessageBox:
     progress.close()
     ```
     """
+    __slots__ = (
+        "message", "title", "parent", "_dialog", "_is_shown", "_last_log_ts",
+    )
 
     def __init__(
             self,
@@ -385,9 +567,10 @@ class ProgressMessageBox:
         ):
         self.message = message
         self.title = title
-        self.parent = parent or MessageBox._get_parent()
+        self.parent = parent or _get_parent()
         self._dialog = None
         self._is_shown = False
+        self._last_log_ts = 0.0
 
     def show(self):
         """Show the progress message box"""
@@ -418,8 +601,15 @@ class ProgressMessageBox:
 
                 else:
                     self._dialog.Pulse(message)
-                    debug.uilog("MESSAGE",
-                               f"Progress updated: {message[:30]}...")
+
+                    # Rate-limited, update_message is called in loops.
+                    now = time.monotonic()
+
+                    if (now - self._last_log_ts >= _PROGRESS_LOG_INTERVAL
+                            and debug.uilog_enabled()):
+                        self._last_log_ts = now
+                        debug.uilog("MESSAGE",
+                                   f"Progress updated: {message[:30]}...")
 
             except Exception as e:
                     debug.uilog("MESSAGE", f"Error updating progress: {e}")
@@ -475,25 +665,25 @@ class InputDialog:
             Optional[str]: The entered text or None if cancelled.
         """
         if parent is None:
-            parent = MessageBox._get_parent()
+            parent = _get_parent()
 
-            try:
-                dlg = wx.TextEntryDialog(parent, message, title,
-                                       default_value)
+        try:
+            dlg = wx.TextEntryDialog(parent, message, title,
+                                   default_value)
 
-                if dlg.ShowModal() == wx.ID_OK:
-                    result = dlg.GetValue()
-                    dlg.Destroy()
-                    debug.uilog("MESSAGE",
-                               f"Text input received: {len(result)} chars")
-                    return result
+            if dlg.ShowModal() == wx.ID_OK:
+                result = dlg.GetValue()
+                dlg.Destroy()
+                debug.uilog("MESSAGE",
+                           f"Text input received: {len(result)} chars")
+                return result
 
-                else:
-                    dlg.Destroy()
-                    return None
+            else:
+                dlg.Destroy()
+                return None
 
-            except Exception as e:
-                debug.uilog("MESSAGE", f"Error getting text input: {e}")
+        except Exception as e:
+            debug.uilog("MESSAGE", f"Error getting text input: {e}")
 
         return None
 
@@ -508,7 +698,7 @@ class InputDialog:
         ) -> Optional[int]:
         """Get number input from user"""
         if parent is None:
-            parent = MessageBox._get_parent()
+            parent = _get_parent()
 
         try:
             dlg = wx.NumberEntryDialog(
@@ -545,7 +735,7 @@ class InputDialog:
         ) -> Optional[str]:
         """Get choice from list"""
         if parent is None:
-            parent = MessageBox._get_parent()
+            parent = _get_parent()
 
         if not choices:
             debug.uilog("MESSAGE", "No choices provided for selection")
@@ -573,24 +763,24 @@ class InputDialog:
 # Convenience functions for quick usage
 def show_info(message: str, title: str = "Information") -> MessageResult:
     """Quick info message"""
-    return MessageBox.info(message, title)
+    return _info(message, title)
 
 def show_warning(message: str, title: str = "Warning") -> MessageResult:
     """Quick warning message"""
-    return MessageBox.warning(message, title)
+    return _warning(message, title)
 
 def show_error(message: str, title: str = "Error") -> MessageResult:
     """Quick error message"""
-    return MessageBox.error(message, title)
+    return _error(message, title)
 
 def ask_question(message: str, title: str = "Question") -> bool:
     """Quick yes/no question - returns True for Yes"""
-    result = MessageBox.question(message, title)
-    return result == MessageResult.YES
+    result = _question(message, title)
+    return result is MessageResult.YES
 
 def show_success(message: str, title: str = "Success") -> MessageResult:
     """Quick success message"""
-    return MessageBox.success(message, title)
+    return _success(message, title)
 
 def get_text_input(message: str, title: str = "Input",
                    default: str = "") -> Optional[str]:
@@ -12,7 +12,6 @@ These mixins enable flexible composition patterns and automatic component
 management in wxPython applications.
 """
 import typing
-import types
 
 
 try:
@@ -28,6 +27,29 @@ except ImportError:
     import mixins_base
 
 
+def _matches(
+    obj: typing.Any,
+    targets: tuple[type, ...],
+    exact_types: frozenset[type] = frozenset()) -> bool:
+    """Check whether obj is a detectable class or instance of targets.
+
+    Combined form of AutoDetect.is_detectable_class and
+    AutoDetect.is_detectable_instance for the attribute scans. Instances
+    whose type is exactly one of exact_types match without an MRO walk.
+    """
+    if type(obj) in exact_types:
+        return True
+
+    if isinstance(obj, type):
+        return (
+            issubclass(obj, targets)
+            and not mixins_core.MixinsType.hasmixins(
+                obj, mixins_base.Multiton)
+        )
+
+    return isinstance(obj, targets)
+
+
 class FixSize:
     """Mixin class to fix the size of UI components.
 
@@ -52,9 +74,18 @@ class FixSize:
         ...         # Panel size is now fixed and cannot be resized
     """
     def __init__(self: core.UIAttributes, *args, **kwds):
+        # Read the current size once.
+        size = self.size
+
+        # Already fixed to this size (repeated __init__ in mixin chains).
+        if size == getattr(self, '_fixsize_applied', None):
+            return
+
         # Fix the size of the window/panel.
-        self.size_max = self.size
-        self.size_min = self.size
+        self.size_max = size
+        self.size_min = size
+
+        self._fixsize_applied = size
 
 
 class AutoDetect:
@@ -90,6 +121,7 @@ class AutoDetect:
         ...         # Windows are automatically detected and managed
     """
     detect_target: tuple[core.UIAttributes, ...] = ()
+    _detect_target_types: frozenset[type] = frozenset()
 
     def __new__(
         cls: typing.Type['AutoDetect'], 
@@ -103,31 +135,24 @@ class AutoDetect:
 
         # Below code was called after super class init.
 
-        # Init children namelist for class-level detection.
-        instance._children_namelist = []
+        # Init children dict here rather than lazily in the property,
+        # __new__ runs before every mixin __init__ that reads it.
+        instance._children = {}
 
-        # Scan class-level attributes using get_all_members from the instance's actual class
-        class_members = mixins_core.MixinsType.get_all_members(cls)
-        debug.internaldebug_log("CHILDREN", f"Class scanning {cls.__name__}, actual class: {cls.__name__}")
-        debug.internaldebug_log("CHILDREN", f"Class members = {class_members}")
+        # Nothing can match an empty detect_target.
+        if not cls.detect_target:
+            instance._children_namelist = []
+            return instance
 
-        debug.internaldebug_log(
-            "CHILDREN", 
-            f"Target is = {instance.detect_target}"
-        )
+        # Init children namelist for class-level detection.
+        # Copied, __init__ appends instance-level detections.
+        instance._children_namelist = list(cls.get_class_children_namelist())
 
-        # Scan class attributes.
-        for attr_name in class_members:
-            # Check target instance.
-            if (cls.is_detectable_class(class_members[attr_name])
-             or cls.is_detectable_instance(class_members[attr_name])):
-                # Add to children namelist.
-                instance._children_namelist.append(attr_name)
-
-        debug.internaldebug_log(
-            "CHILDREN", 
-            f"Class-level __children_namelist__ = {instance._children_namelist}"
-        )
+        if debug.internallog_enabled():
+            debug.internaldebug_log(
+                "CHILDREN", 
+                f"Class-level __children_namelist__ = {instance._children_namelist}"
+            )
 
         # End of __new__.
         return instance
@@ -143,67 +168,87 @@ class AutoDetect:
         # Init children counter.
         self._children_counter = 0
 
+        # Nothing can match an empty detect_target.
+        targets = self.detect_target
+
+        if not targets:
+            return
+
+        exact_types = self._detect_target_types
+        children = self._children
+
+        # Read log levels once, skips message formatting when disabled.
+        internal_log = debug.internallog_enabled()
+        ui_log = debug.uilog_enabled()
+
         # Add instance-level detection for attributes that might be added after __new__
         instance_members = self.get_instance_members()
-        debug.internaldebug_log("CHILDREN", f"Instance members = {instance_members}")
+
+        if internal_log:
+            debug.internaldebug_log("CHILDREN", f"Instance members = {instance_members}")
 
         # Scan instance attributes that weren't found in class-level scan
-        for attr_name in instance_members:
+        for attr_name, value in instance_members.items():
             if attr_name not in self._children_namelist:
                 # Check target instance.
-                if (self.is_detectable_class(instance_members[attr_name])
-                 or self.is_detectable_instance(instance_members[attr_name])):
+                if _matches(value, targets, exact_types):
                     # Add to children namelist.
                     self._children_namelist.append(attr_name)
 
-        debug.internaldebug_log(
-            "CHILDREN", 
-            f"Final __children_namelist__ = {self._children_namelist}"
-        )
+        if internal_log:
+            debug.internaldebug_log(
+                "CHILDREN", 
+                f"Final __children_namelist__ = {self._children_namelist}"
+            )
+
+        # Bind lookups used per child once.
+        is_detectable_class = self.is_detectable_class
+        is_detectable_instance = self.is_detectable_instance
+        set_attribute = self.__setattr__
+        indexor_type = core.UIIndexor
+        counter = self._children_counter
 
         # Scan children namelist.
         for child_name in self._children_namelist:
             # Get child window.
             child = getattr(self, child_name)
 
-            debug.internaldebug_log(
-                "CHILDREN", 
-                f"Item found, {child_name} = {child}"
-            )
+            if internal_log:
+                debug.internaldebug_log(
+                    "CHILDREN", 
+                    f"Item found, {child_name} = {child}"
+                )
 
             # Check detectable subclass.
-            if self.is_detectable_class(child):
+            if is_detectable_class(child):
                 # Create instance.
                 child = child(self)
 
-                debug.uilog(
-                    "CHILDREN", 
-                    f"Constructed, {child_name} = {child}"
-                )
+                if ui_log:
+                    debug.uilog(
+                        "CHILDREN", 
+                        f"Constructed, {child_name} = {child}"
+                    )
 
-            if self.is_detectable_instance(child):
+            if is_detectable_instance(child):
                 # Increase counter.
-                index = core.UIIndexor(
-                    self._children_counter,
-                    self.children
-                )
-                
-                self._children_counter += 1
+                index = indexor_type(counter, children)
+                index_name = "child_" + str(counter)
+
+                counter += 1
+                self._children_counter = counter
 
                 # Set index attribute.
-                setattr(
-                    self, 
-                    f"child_{index}", 
-                    index
-                )
+                set_attribute(index_name, index)
 
-                debug.uilog(
-                    "CHILDREN", 
-                    f"Created, child_{index} = {child_name}	({child})"
-                )
+                if ui_log:
+                    debug.uilog(
+                        "CHILDREN", 
+                        f"Created, {index_name} = {child_name}	({child})"
+                    )
 
                 # Add to children dict.
-                self.children[index] = child
+                children[index] = child
 
     def __class_getitem__(
         cls, 
@@ -219,30 +264,26 @@ class AutoDetect:
                     'or a tuple of core.UIAttributes'
                 )
 
-        # Create new class namespace.
-        new_cls_namespace = cls.get_all_members()
-
-        # Add detect target.
-        new_cls_namespace["detect_target"] = detect_target
+        # Create new class namespace, other members are inherited.
+        new_cls_namespace = {
+            "__module__": cls.__module__,
+            "__doc__": cls.__doc__,
+            # Add detect target.
+            "detect_target": detect_target,
+            # Exact target types, for the fast path in _matches.
+            "_detect_target_types": frozenset(detect_target),
+        }
 
         # Create new class.
         target_names = ', '.join([t.__name__ for t in detect_target])
         class_name = f"{cls.__name__}<{target_names}>"
-        new_cls = types.new_class(
-            class_name,
-            cls.__mro__,
-            {},
-            lambda ns: ns.update(new_cls_namespace)
-        )
+        new_cls = type(class_name, (cls,), new_cls_namespace)
 
         return new_cls
 
     @property
     def children(self) -> dict[core.UIIndexor, typing.Type]:
-        # Lazy init.
-        if not hasattr(self, '_children'):
-            self._children = {}
-
+        # Initialized in __new__.
         return self._children
 
     @classmethod
@@ -269,11 +310,67 @@ class AutoDetect:
 
     @classmethod
     def get_all_members(cls) -> dict[str, typing.Any]:
-        return (
-            mixins_core
-             .MixinsType
-              .get_all_members(cls)
-        )
+        # Cached in the class's own __dict__, so subclasses and new
+        # parameterizations compute their own members. Dunder names, so
+        # mixin merging skips them. MixinsType.__getitem__ drops them
+        # from the copied class dict, and MixinsType drops them when a
+        # class attribute is set or deleted.
+        members = cls.__dict__.get('__members_cache__')
+
+        if members is None:
+            members = (
+                mixins_core
+                 .MixinsType
+                  .get_all_members(cls)
+            )
+
+            # Do not expose base class caches as members.
+            members.pop('__members_cache__', None)
+            members.pop('__children_namelist__', None)
+
+            cls.__members_cache__ = members
+
+        return members
+
+    @classmethod
+    def get_class_children_namelist(cls) -> tuple[str, ...]:
+        """Get the names of detectable class-level attributes.
+
+        The result only depends on the class, so it is computed on the
+        first instantiation and cached in the class's own __dict__
+        until a class attribute is set or deleted.
+
+        Returns:
+            tuple[str, ...]: Names of class attributes matching
+            detect_target, in member order.
+        """
+        namelist = cls.__dict__.get('__children_namelist__')
+
+        if namelist is None:
+            # Scan class-level attributes using get_all_members from the instance's actual class
+            class_members = cls.get_all_members()
+
+            if debug.internallog_enabled():
+                debug.internaldebug_log("CHILDREN", f"Class scanning {cls.__name__}, actual class: {cls.__name__}")
+                debug.internaldebug_log("CHILDREN", f"Class members = {class_members}")
+
+                debug.internaldebug_log(
+                    "CHILDREN", 
+                    f"Target is = {cls.detect_target}"
+                )
+
+            # Scan class attributes.
+            targets = cls.detect_target
+            exact_types = cls._detect_target_types
+            namelist = tuple(
+                attr_name
+                for attr_name, value in class_members.items()
+                if _matches(value, targets, exact_types)
+            )
+
+            cls.__children_namelist__ = namelist
+
+        return namelist
 
     def get_instance_members(self) -> dict[str, typing.Any]:
         """Get all instance members for runtime detection.
@@ -292,10 +389,11 @@ class AutoDetect:
         if hasattr(self, '__dict__'):
             instance_members.update(self.__dict__)
         
-        debug.internaldebug_log(
-            "MEMBERS",
-            f"Instance members of {self.__class__.__name__}: {instance_members}"
-        )
+        if debug.internallog_enabled():
+            debug.internaldebug_log(
+                "MEMBERS",
+                f"Instance members of {self.__class__.__name__}: {instance_members}"
+            )
         
         return instance_members
 
@@ -312,12 +410,8 @@ class AutoDetect:
             tuple[core.UIIndexor, ...]: A tuple containing all child
             indexors found in the instance.
         """
-        indexors = []
-
-        for indexor in self.children:
-            child = self.children[indexor]
-
-            if isinstance(child, target_class):
-                indexors.append(indexor)
-
-        return tuple(indexors)
\ No newline at end of file
+        return tuple(
+            indexor
+            for indexor, child in self._children.items()
+            if isinstance(child, target_class)
+        )
\ No newline at end of file
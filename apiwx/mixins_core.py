@@ -25,7 +25,7 @@ Example:
     >>> SingletonWindow = MyWindow[Singleton]
 """
 import typing
-import types
+import weakref
 import wx.siplib as sip
 
 try:
@@ -34,6 +34,100 @@ except:
     import debug
 
 
+# Bound once, saves the module attribute lookup on every log call site.
+_internaldebug_log = debug.internaldebug_log
+_internallog = debug.internallog
+_internallog_enabled = debug.internallog_enabled
+
+# Merged MRO members per class, see _cached_members.
+_members_cache: 'weakref.WeakKeyDictionary[type, dict[str, typing.Any]]' = (
+    weakref.WeakKeyDictionary()
+)
+
+# Attributes caching results for the class that owns them (AutoDetect),
+# dropped when __getitem__ copies a class dict or a class attribute
+# changes.
+_PER_CLASS_CACHES = ('__members_cache__', '__children_namelist__')
+
+# Classes created by MixinsType.__getitem__, keyed by (cls, mixins).
+# Weak values, so unused generated classes can still be collected.
+_mixins_cache: 'weakref.WeakValueDictionary[tuple, type]' = (
+    weakref.WeakValueDictionary()
+)
+
+
+def _cached_members(cls: type) -> dict[str, typing.Any]:
+    """Get the merged class attributes of cls and its bases.
+
+    The merge is cached per class. Setting or deleting an attribute of
+    a MixinsType class drops the entries of that class and its
+    subclasses, plain mixin classes are expected not to change after
+    definition. The returned dict is shared, do not modify it.
+
+    Args:
+        cls: The class to inspect.
+
+    Returns:
+        dict[str, typing.Any]: Attribute names and raw values, derived
+        classes overriding their bases.
+    """
+    members = _members_cache.get(cls)
+
+    if members is not None:
+        return members
+
+    members = {}
+
+    # Iterate from least specific to most specific (reverse MRO order)
+    # This ensures derived class attributes override base class attributes
+    for base in reversed(cls.__mro__):
+        if base is object:
+            continue # Skip object class.
+
+        members.update(base.__dict__)
+
+    if _internallog_enabled():
+        _internaldebug_log(
+            "MEMBERS",
+            f"All members of {cls.__name__}: {members}"
+        )
+
+    _members_cache[cls] = members
+
+    return members
+
+
+def _invalidate_members(cls: type) -> None:
+    """Drop the cached members of cls and all of its subclasses.
+
+    Both the module cache and the per-class caches stored in each
+    class's own __dict__ are dropped.
+
+    Args:
+        cls: The class whose attributes changed.
+    """
+    pending = [cls]
+    seen = set()
+
+    while pending:
+        klass = pending.pop()
+
+        if klass in seen:
+            continue
+
+        seen.add(klass)
+        _members_cache.pop(klass, None)
+
+        class_dict = klass.__dict__
+
+        for cache_name in _PER_CLASS_CACHES:
+            if cache_name in class_dict:
+                # type's own delattr, not the invalidating override.
+                type.__delattr__(klass, cache_name)
+
+        pending.extend(type.__subclasses__(klass))
+
+
 class MixinsType(sip.wrappertype):
     """Metaclass for mixin type system in wxPython applications.
 
@@ -58,6 +152,12 @@ class MixinsType(sip.wrappertype):
 
     Attributes:
         __mixin_classes__: Tuple containing all applied mixin types.
+        __mixin_classes_set__: Frozenset of the same mixin types.
+        meta__new__: Tuple of mixin __new__ functions.
+        meta__init__: Tuple of mixin __init__ functions.
+
+        All of them default to empty on the metaclass, so every class
+        created by it can read them without a hasattr() check.
 
     Example:
         >>> class MyWindow(wx.Frame, metaclass=MixinsType):
@@ -74,6 +174,14 @@ class MixinsType(sip.wrappertype):
         >>> ComplexWindow = MyWindow[Mixin1, Mixin2]
     """
     __mixin_classes__: tuple[type] = ()
+    # Same mixins as __mixin_classes__, for constant time membership.
+    __mixin_classes_set__: frozenset[type] = frozenset()
+
+    # Mixin __new__/__init__ functions, rebuilt as new tuples when a
+    # mixin is applied. Defaults live on the metaclass, so classes
+    # without mixins resolve them without an AttributeError.
+    meta__new__: tuple[typing.Callable, ...] = ()
+    meta__init__: tuple[typing.Callable, ...] = ()
 
 
     def __getitem__(cls, mixins: type | tuple[type]) -> type:
@@ -81,48 +189,80 @@ class MixinsType(sip.wrappertype):
         if not isinstance(mixins, tuple):
             mixins = (mixins,)
 
+        # Same subscript already created.
+        cache_key = (cls, mixins)
+        new_cls = _mixins_cache.get(cache_key)
+
+        if new_cls is not None:
+            return new_cls
+
         # Check mixins validity.
         base_mixins, mixins = cls._get_base_mixins(mixins)
 
+        # Nothing new to apply, Cls[A][A] is Cls[A].
+        applied = cls.__mixin_classes_set__
+
+        if base_mixins is None and all(
+                mixin_type in applied for mixin_type in mixins):
+            return cls
+
         if base_mixins is not None:
             metaclass = base_mixins
 
         else:
             metaclass = cls.__class__
 
-        # Create new class.
-        new_cls: 'MixinsType' = types.new_class(
-            f"{cls.__name__}<{','.join([t.__name__ for t in mixins])}>",
-            cls.__mro__,
-            {'metaclass': metaclass},
-            lambda ns: ns.update(cls.__dict__)
-        )
-
-        # Add __mixin_classes__ attribute if not exists.
-        if not hasattr(new_cls, '__mixin_classes__'):
-            new_cls.__mixin_classes__ = ()
-
-        if (new_cls.__mixin_classes__ and
-                isinstance(new_cls.__mixin_classes__[0], BaseMixins)):
+        if (cls.__mixin_classes__ and
+                isinstance(cls.__mixin_classes__[0], BaseMixins)):
             raise TypeError(
                 "BaseMixins-derived class is already set as metaclass, "
                 "cannot add another BaseMixins."
             )
 
+        # Build the whole namespace first, so mixin attributes are part
+        # of the class at creation instead of set one by one afterwards.
+        namespace = dict(cls.__dict__)
+
+        # Per-class caches describe cls, not the new class.
+        for cache_name in _PER_CLASS_CACHES:
+            namespace.pop(cache_name, None)
+
         # Add mixins to __mixin_classes__.
-        new_cls.__mixin_classes__ = (
-            (base_mixins,) + new_cls.__mixin_classes__
+        namespace['__mixin_classes__'] = (
+            (base_mixins,) + cls.__mixin_classes__
+        )
+        namespace['__mixin_classes_set__'] = (
+            cls.__mixin_classes_set__ | {base_mixins}
         )
 
         # Create new class namespace.
-        new_cls._mro_mixins_namespace(mixins)
+        # Nothing to merge when only a BaseMixins was given.
+        if mixins:
+            cls._mro_mixins_namespace(mixins, namespace)
 
-        debug.internaldebug_log(
-            "MIXINS", 
-            f"Created new mixins class: {new_cls.__name__} "
-            f"with metaclass {type(new_cls)} and bases {new_cls.__bases__}"
+        # Create new class.
+        # The metaclass is already resolved, so call it directly instead
+        # of going through types.new_class and a namespace callback.
+        new_cls: 'MixinsType' = metaclass(
+            f"{cls.__name__}<{','.join(t.__name__ for t in mixins)}>",
+            cls.__mro__,
+            namespace
         )
 
+        # BaseMixins classes keep per-class instance state (Singleton,
+        # Multiton), so each subscript still gets its own class. That
+        # holds both for a BaseMixins given here and for cls already
+        # having one as its metaclass.
+        if base_mixins is None and not isinstance(cls, BaseMixins):
+            _mixins_cache[cache_key] = new_cls
+
+        if _internallog_enabled():
+            _internaldebug_log(
+                "MIXINS", 
+                f"Created new mixins class: {new_cls.__name__} "
+                f"with metaclass {type(new_cls)} and bases {new_cls.__bases__}"
+            )
+
         return new_cls
 
 
@@ -130,29 +270,55 @@ class MixinsType(sip.wrappertype):
         # First, create instance.
         instance = super().__call__(*args, **kwds)
 
+        meta_news = cls.meta__new__
+        meta_inits = cls.meta__init__
+
+        # No mixin hooks, the merged arguments would be unused.
+        if not (meta_news or meta_inits):
+            return instance
+
         # Get init_args and init_kwds.
-        if hasattr(instance, 'init_args'):
-            args += instance.init_args
+        # core.UIInitializeComponent stores them as _init_args and
+        # _init_kwds in the instance __dict__, read them from there
+        # instead of probing the lazy properties with hasattr().
+        instance_dict = getattr(instance, '__dict__', None)
 
-        if hasattr(instance, 'init_kwds'):
-            kwds.update(instance.init_kwds)
+        if instance_dict is not None:
+            init_args = instance_dict.get('_init_args')
 
-        if hasattr(cls, "meta__new__"):
-            debug.internaldebug_log(
-                "MIXINS", f"mixins.__new__[] = {cls.meta__new__}"
-            )
+            if init_args:
+                args += init_args
+
+            init_kwds = instance_dict.get('_init_kwds')
+
+            if init_kwds:
+                kwds.update(init_kwds)
+
+        else:
+            if hasattr(instance, 'init_args'):
+                args += instance.init_args
+
+            if hasattr(instance, 'init_kwds'):
+                kwds.update(instance.init_kwds)
+
+        if meta_news:
+            if _internallog_enabled():
+                _internaldebug_log(
+                    "MIXINS", f"mixins.__new__[] = {meta_news}"
+                )
 
             # Then, call meta__new__ methods.
-            for meta_new in cls.meta__new__:
+            for meta_new in meta_news:
                 meta_new(cls, instance, *args, **kwds)
 
-        if hasattr(cls, "meta__init__"):
-            debug.internaldebug_log(
-                "MIXINS", f"mixins.__init__[] = {cls.meta__init__}"
-            )
+        if meta_inits:
+            if _internallog_enabled():
+                _internaldebug_log(
+                    "MIXINS", f"mixins.__init__[] = {meta_inits}"
+                )
 
             # Finally, call meta__init__ methods.
-            for meta_init in cls.meta__init__:
+            for meta_init in meta_inits:
                 meta_init(instance, *args, **kwds)
 
         return instance
@@ -165,10 +331,18 @@ class MixinsType(sip.wrappertype):
         mixins: tuple[type] = ()
 
         for mixin_type in _mixins:
-            if issubclass(mixin_type, BaseMixins):
+            if not isinstance(mixin_type, type):
+                raise TypeError(
+                    f"Mixin must be a class, not "
+                    f"{type(mixin_type).__name__}"
+                )
+
+            # Own __dict__ only, a class created by a BaseMixins would
+            # otherwise see the marker through its metaclass.
+            if mixin_type.__dict__.get('_is_base_mixins', False):
                 base_mixins.append(mixin_type)
 
-            elif isinstance(mixin_type, type):
+            else:
                 mixins += (mixin_type,)
 
         if len(base_mixins) > 1:
@@ -182,24 +356,31 @@ class MixinsType(sip.wrappertype):
 
     def _mro_mixins_namespace(
         cls: 'MixinsType', 
-        mixins: tuple[type]
-    ) -> dict:
+        mixins: tuple[type],
+        namespace: dict[str, typing.Any]
+    ) -> dict[str, typing.Any]:
         # Create added namespace.
         added_namespace = {}
 
+        # Collect in a list, frozen into a tuple once below.
+        mixin_classes = list(namespace['__mixin_classes__'])
+        applied = set(namespace['__mixin_classes_set__'])
+
         # Iterate mixins.
         for mixin_type in mixins:
             # Already added.
-            if mixin_type in cls.__mixin_classes__:
-                debug.internaldebug_log(
-                    "MIXINS", 
-                    f"Mixin '{mixin_type.__name__}' already in "
-                    f"__mixin_classes__, skipping"
-                )
+            if mixin_type in applied:
+                if _internallog_enabled():
+                    _internaldebug_log(
+                        "MIXINS", 
+                        f"Mixin '{mixin_type.__name__}' already in "
+                        f"__mixin_classes__, skipping"
+                    )
                 continue
             
             # Add mixins type.
-            cls.__mixin_classes__ += (mixin_type, )
+            mixin_classes.append(mixin_type)
+            applied.add(mixin_type)
 
             if isinstance(mixin_type, sip.wrappertype):
                 # UI type conflict.
@@ -209,97 +390,108 @@ class MixinsType(sip.wrappertype):
                 ... # Target is BaseMixins, skip.
 
             else:
-                cls._namespace_editor(mixin_type, added_namespace)
+                cls._namespace_editor(mixin_type, namespace, added_namespace)
+
+        namespace['__mixin_classes__'] = tuple(mixin_classes)
+        namespace['__mixin_classes_set__'] = frozenset(applied)
 
-        cls._link_namespace(added_namespace)
+        # Mixin attributes override the copied class attributes.
+        namespace.update(added_namespace)
 
-        return None
+        if _internallog_enabled():
+            _internaldebug_log(
+                "NAMESPC",
+                f"namespace was created: {cls.__name__} + {added_namespace}"
+            )
+
+        return namespace
 
 
     def _namespace_editor(
         cls: 'MixinsType', 
         mixin_type: type, 
-        namespace: dict
+        namespace: dict[str, typing.Any],
+        added_namespace: dict[str, typing.Any]
     ):
-        # Check all attributes.
-        for attr_name in MixinsType.get_all_members(mixin_type):
-            # Get attribute.
-            attribute = getattr(mixin_type, attr_name)
+        # A mixin deriving only from object has nothing to merge.
+        if len(mixin_type.__mro__) == 2:
+            members = vars(mixin_type)
 
-            if attr_name == '__new__':
-                if not hasattr(cls, 'meta__new__'):
-                    cls.meta__new__ = []
+        else:
+            members = _cached_members(mixin_type)
 
-                cls.meta__new__.append(attribute)
+        # Check all attributes.
+        # Raw class dict values, not getattr(): classmethods must bind to
+        # the target class they are copied into, not to the mixin.
+        for attr_name, attribute in members.items():
+            if attr_name == '__new__':
+                # __new__ is stored as an implicit staticmethod.
+                if isinstance(attribute, staticmethod):
+                    attribute = attribute.__func__
+
+                # New tuple, never extend one inherited from a base.
+                namespace['meta__new__'] = (
+                    namespace.get('meta__new__', cls.meta__new__)
+                    + (attribute,)
+                )
 
             elif attr_name == '__init__':
-                if not hasattr(cls, 'meta__init__'):
-                    cls.meta__init__ = []
-
-                cls.meta__init__.append(attribute)
+                namespace['meta__init__'] = (
+                    namespace.get('meta__init__', cls.meta__init__)
+                    + (attribute,)
+                )
 
-            elif attr_name.startswith('__') and attr_name.endswith('__'):
+            elif attr_name[:2] == '__' == attr_name[-2:]:
                 continue # Skip special methods and attributes.
         
             else:
-                # Add to namespace if not exists.
-                if attr_name not in namespace:
-                    namespace[attr_name] = attribute
+                # Add to namespace if not exists, one lookup.
+                existing = added_namespace.setdefault(attr_name, attribute)
 
-                else:
+                if existing is not attribute:
                     # Skip existing attributes.
-                    debug.internallog(
-                        "MIXINS",
-                        f"Attribute '{attr_name}' already exists"
-                        f" in class '{cls.__name__}', skipping addition"
-                        f" from mixin '{mixin_type.__name__}'")
+                    if _internallog_enabled(debug.LogLevel.INFO):
+                        _internallog(
+                            "MIXINS",
+                            f"Attribute '{attr_name}' already exists"
+                            f" in class '{cls.__name__}', skipping addition"
+                            f" from mixin '{mixin_type.__name__}'")
     
 
-    def _link_namespace(cls, namespace: dict[str, ]):
-        # Iterate added namespace.
-        for attr_name in namespace:
-            # Get attribute.
-            attribute = namespace[attr_name]
-            # Set attribute to class.
-            setattr(cls, attr_name, attribute)
-
-        debug.internaldebug_log(
-            "NAMESPC",
-            f"namespace was created: {cls.__name__}.__dict__ = {cls.__dict__}"
-        )
+    def hasmixins(cls, mixins: type | tuple[type]) -> bool:
+        applied = cls.__mixin_classes_set__
 
-        return 
+        # Single type, one set lookup.
+        if not isinstance(mixins, tuple):
+            return mixins in applied
 
+        return applied.issuperset(mixins)
+    
 
-    def hasmixins(cls, mixins: type | tuple[type]) -> bool:
-        if not isinstance(mixins, tuple):
-            mixins = (mixins,)
+    def __setattr__(cls, name: str, value: typing.Any) -> None:
+        super().__setattr__(name, value)
 
-        for mixin_type in mixins:
-            if not mixin_type in cls.__mixin_classes__:
-                return False
+        # Storing a cache does not change the members.
+        if name in _PER_CLASS_CACHES:
+            return
 
-        return True
-    
+        # Merged members of this class and its subclasses are stale.
+        _invalidate_members(cls)
 
-    @staticmethod
-    def get_all_members(cls) -> dict[str, typing.Any]:
-        members = {}
 
-        # Iterate from least specific to most specific (reverse MRO order)
-        # This ensures derived class attributes override base class attributes
-        for base in reversed(cls.__mro__):
-            if base is object:
-                continue # Skip object class.
+    def __delattr__(cls, name: str) -> None:
+        super().__delattr__(name)
 
-            members.update(base.__dict__)
+        if name in _PER_CLASS_CACHES:
+            return
 
-        debug.internaldebug_log(
-            "MEMBERS",
-            f"All members of {cls.__name__}: {members}"
-        )
+        _invalidate_members(cls)
 
-        return members
+
+    @staticmethod
+    def get_all_members(cls) -> dict[str, typing.Any]:
+        # Callers own the returned dict, hand out a copy of the cache.
+        return dict(_cached_members(cls))
 
 
 class BaseMixins(MixinsType):
@@ -356,4 +548,11 @@ class BaseMixins(MixinsType):
         >>> obj2 = MyClass()  # Returns same instance
         >>> assert obj1 is obj2  # True
     """
-    pass
\ No newline at end of file
+    # Marks BaseMixins and every subclass in its own __dict__, so
+    # _get_base_mixins can tell them apart without an issubclass() walk.
+    _is_base_mixins: bool = True
+
+    def __init_subclass__(cls, **kwds):
+        super().__init_subclass__(**kwds)
+
+        cls._is_base_mixins = True
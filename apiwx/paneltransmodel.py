@@ -14,18 +14,17 @@ The transition system automatically manages panel visibility, allowing
 only one panel to be visible at a time while maintaining references to
 all panels for quick switching operations.
 """
+import typing
 
 
 try:
     from . import core
     from . import debug
-    from .mixins_core import MixinsType
     from . import mixins_window
 
 except ImportError:
     import core
     import debug
-    from mixins_core import MixinsType
     import mixins_window
 
 
@@ -44,6 +43,18 @@ class NotTransition:
     pass
 
 
+def _is_not_transition(panel_class: type) -> bool:
+    """Check whether panel_class was created with the NotTransition mixin.
+
+    The applied mixins are stored as a frozenset on the class when
+    MixinsType creates it, so this is a class attribute read and one set
+    lookup. Classes without mixins fall back to an empty set.
+    """
+    return NotTransition in getattr(
+        panel_class, '__mixin_classes_set__', frozenset()
+    )
+
+
 class SupportTransit(mixins_window.DetectPanel):
     """Mixin class to add transition support to panels.
 
@@ -94,14 +105,11 @@ class SupportTransit(mixins_window.DetectPanel):
 
         self._panel_trans = PanelTransModel()
 
-        for child_id in self.children:
-            child: core.Panel = self.children[child_id]
-
-            if not MixinsType.hasmixins(child, NotTransition):
-                self.panel_trans.add(child_id, child)
+        self.panel_trans.add_many(self.children.items())
 
-        debug.internaldebug_log("TRANSIT",
-                               "Panels: {}".format(self.panel_trans))
+        if debug.internallog_enabled():
+            debug.internaldebug_log("TRANSIT",
+                                   "Panels: {}".format(self.panel_trans))
 
 
 class TransitPanelContainer:
@@ -129,31 +137,45 @@ class TransitPanelContainer:
         """
         self.panel_trans = PanelTransModel()
 
-        debug.internaldebug_log("TRANSIT",
-                               "Panels: {}".format(self.panel_trans))
-
-        for child_id in self.children:
-            child: core.Panel = self.children[child_id]
+        if debug.internallog_enabled():
+            debug.internaldebug_log("TRANSIT",
+                                   "Panels: {}".format(self.panel_trans))
 
-            if not MixinsType.hasmixins(child, NotTransition):
-                self.panel_trans.add(child_id, child)
+        self.panel_trans.add_many(self.children.items())
 
 
-class PanelTransModel(dict[core.UIIndexor, core.Panel]):
+class PanelTransModel:
     """Panel transition model for managing panel visibility.
 
-    This class extends dict to provide a mapping between UI indexors and
-    wrapped panels, with automatic visibility management. Only one panel
-    can be visible at a time, and transitions between panels are handled
-    automatically.
+    This class provides a mapping between UI indexors and wrapped panels,
+    with automatic visibility management. Only one panel can be visible
+    at a time, and transitions between panels are handled automatically.
 
     The model maintains the current active panel and provides methods for
     adding, removing, and transitioning between panels.
 
+    The model is not a dict subclass, so entries can only be stored
+    through add(), __setitem__() and update(). Read access follows the
+    mapping protocol (in, len, iteration, indexing, keys, values, items
+    and get).
+
+    Indexors and panels are kept in parallel lists in insertion order,
+    so bulk operations over all panels iterate plain lists instead of
+    walking a mapping.
+
     Attributes:
         _now (core.UIIndexor | None): The currently active panel indexor.
+        _indexors (list[core.UIIndexor]): Indexors in insertion order.
+        _panels (list[core.Panel]): Panels, parallel to _indexors.
+        _index (dict[core.UIIndexor, int]): Position of each indexor in
+            the parallel lists.
     """
+    __slots__ = ("_now", "_indexors", "_panels", "_index")
+
     _now: core.UIIndexor | None
+    _indexors: list[core.UIIndexor]
+    _panels: list[core.Panel]
+    _index: dict[core.UIIndexor, int]
 
     @property
     def now(self) -> core.UIIndexor | None:
@@ -197,9 +219,47 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
 
         Sets up an empty model with no active panel.
         """
-        super(PanelTransModel, self).__init__()
-
         self._now = None
+        self._indexors = []
+        self._panels = []
+        self._index = {}
+
+    def __contains__(self, indexor: object) -> bool:
+        return indexor in self._index
+
+    def __len__(self) -> int:
+        return len(self._indexors)
+
+    def __iter__(self) -> typing.Iterator[core.UIIndexor]:
+        return iter(self._indexors)
+
+    def __getitem__(self, indexor: core.UIIndexor) -> core.Panel:
+        return self._panels[self._index[indexor]]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({dict(self.items())!r})"
+
+    def keys(self) -> tuple[core.UIIndexor, ...]:
+        """Get the indexors in insertion order."""
+        return tuple(self._indexors)
+
+    def values(self) -> tuple[core.Panel, ...]:
+        """Get the panels in insertion order."""
+        return tuple(self._panels)
+
+    def items(self) -> tuple[tuple[core.UIIndexor, core.Panel], ...]:
+        """Get (indexor, panel) pairs in insertion order."""
+        return tuple(zip(self._indexors, self._panels))
+
+    def get(self, indexor: core.UIIndexor,
+            default: core.Panel | None = None) -> core.Panel | None:
+        """Get the panel for indexor, or default if it is not managed."""
+        position = self._index.get(indexor)
+
+        if position is None:
+            return default
+
+        return self._panels[position]
 
     def add(self, indexor: core.UIIndexor, panel: core.Panel) -> None:
         """Add a panel with the given indexor.
@@ -219,13 +279,13 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
             raise TypeError('panel must be an instance of '
                           'core.Panel')
 
-        if indexor in self:
+        if indexor in self._index:
             raise KeyError('indexor already exists')
 
-        if MixinsType.hasmixins(panel.__class__, NotTransition):
+        if _is_not_transition(panel.__class__):
             return  # Do nothing for NotTransition panels
 
-        if len(self) == 0:
+        if not self._indexors:
             # Make sure the panel is shown first
             self._now = indexor
 
@@ -233,7 +293,60 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
             # Hide the panel
             panel.Hide()
 
-        super(PanelTransModel, self).__setitem__(indexor, panel)
+        self._unchecked_set(indexor, panel)
+
+    def add_many(self, pairs) -> None:
+        """Add several panels with the same rules as add().
+
+        All pairs are validated before any panel is stored or hidden, so
+        a bad pair leaves the model unchanged. NotTransition panels are
+        skipped. If the model is empty, the first added panel becomes
+        the current one and the others are hidden.
+
+        Args:
+            pairs: Iterable of (indexor, panel) pairs, for example
+                children.items().
+
+        Raises:
+            TypeError: If an indexor or panel is not of correct type.
+            KeyError: If an indexor already exists in the model or is
+                repeated in pairs.
+        """
+        items = []
+        seen = set()
+
+        for indexor, panel in pairs:
+            if not isinstance(indexor, core.UIIndexor):
+                raise TypeError('indexor must be an instance of '
+                                'core.UIIndexor')
+
+            if not isinstance(panel, core.Panel):
+                raise TypeError('panel must be an instance of '
+                              'core.Panel')
+
+            if indexor in self._index or indexor in seen:
+                raise KeyError('indexor already exists')
+
+            seen.add(indexor)
+
+            if not _is_not_transition(panel.__class__):
+                items.append((indexor, panel))
+
+        if not items:
+            return
+
+        hidden = items
+
+        if not self._indexors:
+            # Make sure the first panel is shown
+            self._now = items[0][0]
+            hidden = items[1:]
+
+        for _, panel in hidden:
+            panel.Hide()
+
+        for indexor, panel in items:
+            self._unchecked_set(indexor, panel)
 
     def __setitem__(self, indexor: core.UIIndexor,
                     panel: core.Panel) -> None:
@@ -245,17 +358,117 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
         """
         self.add(indexor, panel)
 
+    def _unchecked_set(self, indexor: core.UIIndexor,
+                       panel: core.Panel) -> None:
+        """Store a panel without validation or visibility handling.
+
+        Only for entries that were already validated by another
+        PanelTransModel. External callers should use add().
+
+        Args:
+            indexor (core.UIIndexor): The unique identifier for the panel.
+            panel (core.Panel): The panel to store.
+        """
+        position = self._index.get(indexor)
+
+        if position is None:
+            self._index[indexor] = len(self._panels)
+            self._indexors.append(indexor)
+            self._panels.append(panel)
+
+        else:
+            self._panels[position] = panel
+
+    def update(self, other=(), **kwds) -> None:
+        """Add panels from a mapping or iterable of pairs.
+
+        Entries coming from another PanelTransModel have already passed
+        the add() type checks, so they are copied without re-validating
+        their types. Existing indexors are still rejected, and the copied
+        panels are hidden if this model already has a current panel.
+        Any other source is routed through add_many().
+
+        Args:
+            other: A PanelTransModel, mapping or iterable of
+                (indexor, panel) pairs.
+            **kwds: Not supported, indexors are not strings.
+
+        Raises:
+            TypeError: If keyword arguments are given.
+            KeyError: If an indexor already exists in the model.
+        """
+        if kwds:
+            raise TypeError('indexor must be an instance of core.UIIndexor')
+
+        if isinstance(other, PanelTransModel):
+            index = self._index
+
+            for indexor in other._indexors:
+                if indexor in index:
+                    raise KeyError('indexor already exists')
+
+            if self._now is None:
+                self._now = other._now
+
+            else:
+                # Keep a single visible panel.
+                for panel in other._panels:
+                    panel.Hide()
+
+            for indexor, panel in zip(other._indexors, other._panels):
+                self._unchecked_set(indexor, panel)
+
+            return
+
+        if hasattr(other, 'keys'):
+            other = ((indexor, other[indexor]) for indexor in other.keys())
+
+        self.add_many(other)
+
     def remove(self, indexor: core.UIIndexor) -> None:
         """Remove the panel with the given indexor.
 
         Args:
             indexor (core.UIIndexor): The indexor of the panel to remove.
         """
-        if indexor in self:
-            if self.now == indexor:
-                self.now = None
+        position = self._index.pop(indexor, None)
+
+        if position is None:
+            return
+
+        if self.now == indexor:
+            self.now = None
+
+        del self._indexors[position]
+        del self._panels[position]
+
+        # Shift positions of the following entries.
+        for shifted in range(position, len(self._indexors)):
+            self._index[self._indexors[shifted]] = shifted
+
+    def __delitem__(self, indexor: core.UIIndexor) -> None:
+        """Remove a panel using dictionary syntax.
+
+        Args:
+            indexor (core.UIIndexor): The indexor of the panel to remove.
+
+        Raises:
+            KeyError: If indexor does not exist in the model.
+        """
+        if indexor not in self._index:
+            raise KeyError(indexor)
+
+        self.remove(indexor)
+
+    def hide_all(self) -> None:
+        """Hide every managed panel.
+
+        After this call no panel is active.
+        """
+        for panel in self._panels:
+            panel.Hide()
 
-            super(PanelTransModel, self).__delitem__(indexor)
+        self._now = None
 
     def trans(self, indexor: core.UIIndexor) -> bool:
         """Transition to the panel with the given indexor.
@@ -266,11 +479,15 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
         Returns:
             bool: True if any panel is now visible, False otherwise.
         """
-        if self.now is not None:
+        # Already current, skip the hide/show round-trip.
+        if indexor is self._now:
+            return self._now is not None
+
+        if self._now is not None:
             self._now.hide()
             self._now = None
 
-        if indexor in self:
+        if indexor in self._index:
             if indexor.show():
                 self._now = indexor
 
@@ -40,10 +40,11 @@ from .fontmanager import FontManager
 from .debug import (
     Logger, LogLevel,
     uilog, uidebug_log, uiinfo_log, uiwarning_log, uierror_log, uicritical_log,
-    uidebug_set_level, uidebug_get_level, uilog_output_remaining,
+    uidebug_set_level, uidebug_get_level, uilog_enabled,
+    uilog_output_remaining,
     internallog, internaldebug_log, internalinfo_log, internalwarning_log,
     internalerror_log, internalcritical_log, internal_set_level,
-    internal_get_level, internallog_output_remaining
+    internal_get_level, internallog_enabled, internallog_output_remaining
 )
 
 # === Panel Transition Model ===
@@ -77,6 +77,7 @@ def uierror_log(tag: str, message: str) -> None: ...
 def uicritical_log(tag: str, message: str) -> None: ...
 def uidebug_set_level(level: LogLevel) -> None: ...
 def uidebug_get_level() -> LogLevel: ...
+def uilog_enabled(level: LogLevel = ...) -> bool: ...
 def uilog_output_remaining() -> None: ...
 
 # Internal Logger Functions
@@ -88,6 +89,7 @@ def internalerror_log(tag: str, message: str) -> None: ...
 def internalcritical_log(tag: str, message: str) -> None: ...
 def internal_set_level(level: LogLevel) -> None: ...
 def internal_get_level() -> LogLevel: ...
+def internallog_enabled(level: LogLevel = ...) -> bool: ...
 def internallog_output_remaining() -> None: ...
 
 # Global logger instances
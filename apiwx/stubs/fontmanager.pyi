@@ -5,10 +5,10 @@ for wxPython applications, including centralized font creation, storage, and
 retrieval with automatic key generation and multiple access patterns.
 """
 
-from typing import overload, Type
+from typing import overload, Iterator, ItemsView, KeysView, Type, ValuesView
 import wx
 
-class FontManager(dict[str, wx.Font]):
+class FontManager:
     """Singleton font manager for wxPython applications.
     
     Provides centralized font creation and management using a dictionary-based
@@ -18,10 +18,13 @@ class FontManager(dict[str, wx.Font]):
     
     instance: Type['FontManager'] | None
     font_family: str
+    _fonts: dict[str, wx.Font]
+    _font_to_key: dict[int, str]
+    _initialized: bool
     
     def __new__(cls, *args, **kwargs) -> 'FontManager': ...
     
-    def __init__(self, font_family: str = ...) -> None: ...
+    def __init__(self, font_family: str | None = ...) -> None: ...
     
     def create_by_parameter(
         self,
@@ -88,9 +91,16 @@ class FontManager(dict[str, wx.Font]):
         """
         ...
     
-    @classmethod
+    def __contains__(self, keyname: object) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[str]: ...
+    def keys(self) -> KeysView[str]: ...
+    def values(self) -> ValuesView[wx.Font]: ...
+    def items(self) -> ItemsView[str, wx.Font]: ...
+    def get(self, keyname: str, default: wx.Font | None = ...) -> wx.Font | None: ...
+    
+    @staticmethod
     def parameter_to_keyname(
-        cls,
         size: int,
         weight: int = ...,
         style: int = ...,
@@ -156,11 +166,13 @@ class FontManager(dict[str, wx.Font]):
     def get_font(keyname: str) -> wx.Font: ...
     
     @staticmethod
-    def get_font(*args) -> wx.Font:
+    def get_font(*args, **kwds) -> wx.Font:
         """Retrieve a font from the singleton FontManager instance.
         
         Args:
-            *args: Variable arguments for either key name or parameters.
+            *args: Variable arguments for either key name, a parameter
+                tuple or parameters.
+            **kwds: Keyword form of the font parameters.
             
         Returns:
             The wx.Font object corresponding to the specified parameters or key name.
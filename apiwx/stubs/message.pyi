@@ -92,10 +92,11 @@ class CustomMessageBox:
     
     message: str
     title: str
-    buttons: int
-    icon: int
-    default_button: Optional[MessageResult]
     parent: Optional[wx.Window]
+    _buttons: int
+    _icon: int
+    _default_button: Optional[MessageResult]
+    _style: int
     
     def __init__(
         self,
@@ -107,6 +108,26 @@ class CustomMessageBox:
         parent: Optional[wx.Window] = ...
     ) -> None: ...
     
+    @property
+    def buttons(self) -> int: ...
+    
+    @buttons.setter
+    def buttons(self, buttons: Union[MessageButtons, int]) -> None: ...
+    
+    @property
+    def icon(self) -> int: ...
+    
+    @icon.setter
+    def icon(self, icon: int) -> None: ...
+    
+    @property
+    def default_button(self) -> Optional[MessageResult]: ...
+    
+    @default_button.setter
+    def default_button(self, default_button: Optional[MessageResult]) -> None: ...
+    
+    def _update_style(self) -> None: ...
+    
     def show(self) -> MessageResult: ...
 
 class ProgressMessageBox:
@@ -117,6 +138,7 @@ class ProgressMessageBox:
     parent: Optional[wx.Window]
     _dialog: Optional[wx.ProgressDialog]
     _is_shown: bool
+    _last_log_ts: float
     
     def __init__(
         self,
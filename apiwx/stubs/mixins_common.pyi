@@ -43,6 +43,9 @@ class AutoDetect(Generic[T]):
     @classmethod
     def get_all_members(cls) -> Dict[str, Any]: ...
     
+    @classmethod
+    def get_class_children_namelist(cls) -> Tuple[str, ...]: ...
+    
     @classmethod
     def is_detectable_class(cls, classobj: Type) -> bool: ...
     
@@ -22,6 +22,9 @@ class MixinsType(sip.wrappertype):
     """
     
     __mixin_classes__: tuple[type, ...]
+    __mixin_classes_set__: frozenset[type]
+    meta__new__: tuple[typing.Callable[..., Any], ...]
+    meta__init__: tuple[typing.Callable[..., Any], ...]
     
     def __getitem__(cls, mixins: Union[type, Tuple[type, ...]]) -> type: ...
     def __call__(cls, *args: Any, **kwds: Any) -> Any: ...
@@ -33,19 +36,22 @@ class MixinsType(sip.wrappertype):
     
     def _mro_mixins_namespace(
         cls, 
-        mixins: Tuple[type, ...]
+        mixins: Tuple[type, ...],
+        namespace: Dict[str, Any]
     ) -> Dict[str, Any]: ...
     
     def _namespace_editor(
         cls,
+        mixin_type: type,
         namespace: Dict[str, Any],
-        mixins: Tuple[type, ...]
-    ) -> Dict[str, Any]: ...
-    
-    def _link_namespace(cls, namespace: Dict[str, Any]) -> None: ...
+        added_namespace: Dict[str, Any]
+    ) -> None: ...
     
     def hasmixins(cls, mixins: Union[type, Tuple[type, ...]]) -> bool: ...
     
+    def __setattr__(cls, name: str, value: Any) -> None: ...
+    def __delattr__(cls, name: str) -> None: ...
+    
     @staticmethod
     def get_all_members(cls: type) -> Dict[str, Any]: ...
 
@@ -77,4 +83,6 @@ class BaseMixins(MixinsType):
         >>> obj2 = SingletonClass()
         >>> assert obj1 is obj2
     """
-    pass
\ No newline at end of file
+    _is_base_mixins: bool
+    
+    def __init_subclass__(cls, **kwds: Any) -> None: ...
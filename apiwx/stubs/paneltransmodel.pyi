@@ -5,7 +5,7 @@ functionality, enabling smooth panel switching and visibility management
 within window containers in wxPython applications.
 """
 
-from typing import Optional
+from typing import Iterable, Iterator, Optional
 from . import core
 from .generics_core import GenericsType
 from . import generics_window
@@ -58,15 +58,21 @@ class TransitPanelContainer:
         """Initialize the panel container with transition support."""
         ...
 
-class PanelTransModel(dict[core.UIIndexor, core.Panel]):
+class PanelTransModel:
     """Panel transition model for managing panel visibility.
     
-    This class extends dict to provide a mapping between UI indexors and
-    wrapped panels, with automatic visibility management. Only one panel
-    can be visible at a time.
+    This class provides a mapping between UI indexors and wrapped panels,
+    with automatic visibility management. Only one panel can be visible
+    at a time. Entries are only stored through add(), __setitem__() and
+    update().
     """
     
+    __slots__ = ("_now", "_indexors", "_panels", "_index")
+    
     _now: Optional[core.UIIndexor]
+    _indexors: list[core.UIIndexor]
+    _panels: list[core.Panel]
+    _index: dict[core.UIIndexor, int]
     
     @property
     def now(self) -> Optional[core.UIIndexor]:
@@ -102,6 +108,32 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
         """Initialize the panel transition model."""
         ...
     
+    def __contains__(self, indexor: object) -> bool: ...
+    def __len__(self) -> int: ...
+    def __iter__(self) -> Iterator[core.UIIndexor]: ...
+    def __getitem__(self, indexor: core.UIIndexor) -> core.Panel: ...
+    def __repr__(self) -> str: ...
+    
+    def keys(self) -> tuple[core.UIIndexor, ...]:
+        """Get the indexors in insertion order."""
+        ...
+    
+    def values(self) -> tuple[core.Panel, ...]:
+        """Get the panels in insertion order."""
+        ...
+    
+    def items(self) -> tuple[tuple[core.UIIndexor, core.Panel], ...]:
+        """Get (indexor, panel) pairs in insertion order."""
+        ...
+    
+    def get(
+        self,
+        indexor: core.UIIndexor,
+        default: Optional[core.Panel] = ...
+    ) -> Optional[core.Panel]:
+        """Get the panel for indexor, or default if it is not managed."""
+        ...
+    
     def add(self, indexor: core.UIIndexor, panel: core.Panel) -> None:
         """Add a panel with the given indexor.
         
@@ -115,10 +147,36 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
         """
         ...
     
+    def add_many(
+        self,
+        pairs: Iterable[tuple[core.UIIndexor, core.Panel]]
+    ) -> None:
+        """Add several panels with the same rules as add().
+        
+        All pairs are validated before any panel is stored or hidden.
+        
+        Args:
+            pairs: Iterable of (indexor, panel) pairs.
+            
+        Raises:
+            TypeError: If an indexor or panel is not of correct type.
+            KeyError: If an indexor already exists or is repeated.
+        """
+        ...
+    
     def __setitem__(self, indexor: core.UIIndexor, panel: core.Panel) -> None:
         """Add a panel using dictionary syntax."""
         ...
     
+    def update(self, other=..., **kwds) -> None:
+        """Add panels from a mapping or iterable of pairs.
+        
+        Entries from another PanelTransModel skip the type checks but
+        still reject existing indexors, and are hidden if a panel is
+        already current; other sources go through add_many().
+        """
+        ...
+    
     def remove(self, indexor: core.UIIndexor) -> None:
         """Remove the panel with the given indexor.
         
@@ -127,6 +185,14 @@ class PanelTransModel(dict[core.UIIndexor, core.Panel]):
         """
         ...
     
+    def __delitem__(self, indexor: core.UIIndexor) -> None:
+        """Remove a panel using dictionary syntax."""
+        ...
+    
+    def hide_all(self) -> None:
+        """Hide every managed panel."""
+        ...
+    
     def trans(self, indexor: core.UIIndexor) -> bool:
         """Transition to the panel with the given indexor.
         
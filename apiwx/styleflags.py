@@ -23,171 +23,169 @@ Usage:
     >>> window = wx.Frame(None, style=frame_style | border_style)
 """
 
-from wx import (
-    # Basic window and frame styles
-    DEFAULT_FRAME_STYLE,
-    HSCROLL,
-    VSCROLL,
-    LC_REPORT,
-    
-    # Control styles
-    SL_HORIZONTAL,
-    GA_HORIZONTAL,
-    
-    # Border styles
-    SIMPLE_BORDER,
-    SUNKEN_BORDER,
-    RAISED_BORDER,
-    NO_BORDER,
-    
-    # Traversal styles
-    TAB_TRAVERSAL,
-    WANTS_CHARS,
-    
-    # Extended window styles
-    WS_EX_VALIDATE_RECURSIVELY,
-    WS_EX_BLOCK_EVENTS,
-    WS_EX_TRANSIENT,
-    WS_EX_PROCESS_IDLE,
-    WS_EX_PROCESS_UI_UPDATES,
-    
-    # Frame styles
-    FRAME_SHAPED,
-    FRAME_TOOL_WINDOW,
-    FRAME_NO_TASKBAR,
-    FRAME_FLOAT_ON_PARENT,
-    
-    # Dialog styles
-    DEFAULT_DIALOG_STYLE,
-    RESIZE_BORDER,
-    DIALOG_NO_PARENT,
-    DIALOG_EX_METAL,
-    
-    # Control border styles
-    BORDER_NONE,
-    BORDER_SIMPLE,
-    BORDER_SUNKEN,
-    BORDER_RAISED,
-    BORDER_STATIC,
-    BORDER_THEME,
-    
-    # Fullscreen flags
-    FULLSCREEN_NOMENUBAR,
-    FULLSCREEN_NOTOOLBAR,
-    FULLSCREEN_NOSTATUSBAR,
-    FULLSCREEN_NOBORDER,
-    FULLSCREEN_NOCAPTION,
-    FULLSCREEN_ALL,
-)
-
-
-class WindowStyle:
-    """Basic window and frame style constants.
+# Style classes and their (attribute, wx name) pairs. The classes are
+# built on first access through the module __getattr__ below (PEP 562),
+# so importing this module does not import wx by itself.
+_CLASS_SPECS = {
+    'WindowStyle': (
+        """Basic window and frame style constants.
     
     This class provides convenient access to common window and frame
     style flags used in wxPython applications.
-    """
-    DEFAULT_FRAME_STYLE = DEFAULT_FRAME_STYLE
-    HSCROLL = HSCROLL
-    VSCROLL = VSCROLL
-    LC_REPORT = LC_REPORT
-
-
-class ControlStyle:
-    """Control-specific style constants.
+    """,
+        (
+            ('DEFAULT_FRAME_STYLE', 'DEFAULT_FRAME_STYLE'),
+            ('HSCROLL', 'HSCROLL'),
+            ('VSCROLL', 'VSCROLL'),
+            ('LC_REPORT', 'LC_REPORT'),
+        ),
+    ),
+    'ControlStyle': (
+        """Control-specific style constants.
     
     This class provides style flags specific to UI controls
     like sliders, gauges, and other widgets.
-    """
-    SL_HORIZONTAL = SL_HORIZONTAL
-    GA_HORIZONTAL = GA_HORIZONTAL
-
-
-class BorderStyle:
-    """Border appearance style constants.
+    """,
+        (
+            ('SL_HORIZONTAL', 'SL_HORIZONTAL'),
+            ('GA_HORIZONTAL', 'GA_HORIZONTAL'),
+        ),
+    ),
+    'BorderStyle': (
+        """Border appearance style constants.
     
     This class provides different border styles that can be
     applied to windows and controls.
-    """
-    SIMPLE = SIMPLE_BORDER
-    SUNKEN = SUNKEN_BORDER
-    RAISED = RAISED_BORDER
-    NONE = NO_BORDER
-
-
-class TraversalStyle:
-    """Keyboard traversal and input style constants.
+    """,
+        (
+            ('SIMPLE', 'SIMPLE_BORDER'),
+            ('SUNKEN', 'SUNKEN_BORDER'),
+            ('RAISED', 'RAISED_BORDER'),
+            ('NONE', 'NO_BORDER'),
+        ),
+    ),
+    'TraversalStyle': (
+        """Keyboard traversal and input style constants.
     
     This class provides flags that control keyboard navigation
     and character input behavior.
-    """
-    TAB_TRAVERSAL = TAB_TRAVERSAL
-    WANTS_CHARS = WANTS_CHARS
-
-
-class ExtraWindowStyle:
-    """Extended window behavior style constants.
+    """,
+        (
+            ('TAB_TRAVERSAL', 'TAB_TRAVERSAL'),
+            ('WANTS_CHARS', 'WANTS_CHARS'),
+        ),
+    ),
+    'ExtraWindowStyle': (
+        """Extended window behavior style constants.
     
     This class provides additional window behavior flags
     for validation, event handling, and UI updates.
-    """
-    VALIDATE_RECURSIVELY = WS_EX_VALIDATE_RECURSIVELY
-    BLOCK_EVENTS = WS_EX_BLOCK_EVENTS
-    TRANSIENT = WS_EX_TRANSIENT
-    PROCESS_IDLE = WS_EX_PROCESS_IDLE
-    PROCESS_UI_UPDATES = WS_EX_PROCESS_UI_UPDATES
-
-
-class FrameStyle:
-    """Frame-specific style constants.
+    """,
+        (
+            ('VALIDATE_RECURSIVELY', 'WS_EX_VALIDATE_RECURSIVELY'),
+            ('BLOCK_EVENTS', 'WS_EX_BLOCK_EVENTS'),
+            ('TRANSIENT', 'WS_EX_TRANSIENT'),
+            ('PROCESS_IDLE', 'WS_EX_PROCESS_IDLE'),
+            ('PROCESS_UI_UPDATES', 'WS_EX_PROCESS_UI_UPDATES'),
+        ),
+    ),
+    'FrameStyle': (
+        """Frame-specific style constants.
     
     This class provides style flags specific to frame windows,
     including tool windows and floating frames.
-    """
-    FRAME_SHAPED = FRAME_SHAPED
-    FRAME_TOOL_WINDOW = FRAME_TOOL_WINDOW
-    FRAME_NO_TASKBAR = FRAME_NO_TASKBAR
-    FRAME_FLOAT_ON_PARENT = FRAME_FLOAT_ON_PARENT
-
-
-class DialogStyle:
-    """Dialog window style constants.
+    """,
+        (
+            ('FRAME_SHAPED', 'FRAME_SHAPED'),
+            ('FRAME_TOOL_WINDOW', 'FRAME_TOOL_WINDOW'),
+            ('FRAME_NO_TASKBAR', 'FRAME_NO_TASKBAR'),
+            ('FRAME_FLOAT_ON_PARENT', 'FRAME_FLOAT_ON_PARENT'),
+        ),
+    ),
+    'DialogStyle': (
+        """Dialog window style constants.
     
     This class provides style flags specific to dialog windows
     and modal dialogs.
-    """
-    DEFAULT_DIALOG_STYLE = DEFAULT_DIALOG_STYLE
-    RESIZE_BORDER = RESIZE_BORDER
-    DIALOG_NO_PARENT = DIALOG_NO_PARENT
-    DIALOG_EX_METAL = DIALOG_EX_METAL
-
-
-class ControlBorderStyle:
-    """Control border style constants.
+    """,
+        (
+            ('DEFAULT_DIALOG_STYLE', 'DEFAULT_DIALOG_STYLE'),
+            ('RESIZE_BORDER', 'RESIZE_BORDER'),
+            ('DIALOG_NO_PARENT', 'DIALOG_NO_PARENT'),
+            ('DIALOG_EX_METAL', 'DIALOG_EX_METAL'),
+        ),
+    ),
+    'ControlBorderStyle': (
+        """Control border style constants.
     
     This class provides border styles specifically designed
     for UI controls and widgets.
-    """
-    NONE = BORDER_NONE
-    SIMPLE = BORDER_SIMPLE
-    SUNKEN = BORDER_SUNKEN
-    RAISED = BORDER_RAISED
-    STATIC = BORDER_STATIC
-    THEME = BORDER_THEME
-
-
-class MiscFlag:
-    """Miscellaneous style and behavior flags.
+    """,
+        (
+            ('NONE', 'BORDER_NONE'),
+            ('SIMPLE', 'BORDER_SIMPLE'),
+            ('SUNKEN', 'BORDER_SUNKEN'),
+            ('RAISED', 'BORDER_RAISED'),
+            ('STATIC', 'BORDER_STATIC'),
+            ('THEME', 'BORDER_THEME'),
+        ),
+    ),
+    'MiscFlag': (
+        """Miscellaneous style and behavior flags.
     
     This class provides various flags including fullscreen
     options and other miscellaneous style flags.
-    """
-    FULLSCREEN_NOMENUBAR = FULLSCREEN_NOMENUBAR
-    FULLSCREEN_NOTOOLBAR = FULLSCREEN_NOTOOLBAR
-    FULLSCREEN_NOSTATUSBAR = FULLSCREEN_NOSTATUSBAR
-    FULLSCREEN_NOBORDER = FULLSCREEN_NOBORDER
-    FULLSCREEN_NOCAPTION = FULLSCREEN_NOCAPTION
-    FULLSCREEN_ALL = FULLSCREEN_ALL
+    """,
+        (
+            ('FULLSCREEN_NOMENUBAR', 'FULLSCREEN_NOMENUBAR'),
+            ('FULLSCREEN_NOTOOLBAR', 'FULLSCREEN_NOTOOLBAR'),
+            ('FULLSCREEN_NOSTATUSBAR', 'FULLSCREEN_NOSTATUSBAR'),
+            ('FULLSCREEN_NOBORDER', 'FULLSCREEN_NOBORDER'),
+            ('FULLSCREEN_NOCAPTION', 'FULLSCREEN_NOCAPTION'),
+            ('FULLSCREEN_ALL', 'FULLSCREEN_ALL'),
+        ),
+    ),
+}
+
+# Raw wx names also re-exported at module level (e.g. styleflags.VSCROLL).
+_WX_NAMES = frozenset(
+    wx_name
+    for _, pairs in _CLASS_SPECS.values()
+    for _, wx_name in pairs
+)
+
+
+def __getattr__(name: str):
+    if name in _CLASS_SPECS:
+        import wx
+
+        doc, pairs = _CLASS_SPECS[name]
+        namespace = {'__module__': __name__, '__doc__': doc}
+        namespace.update(
+            (attr_name, getattr(wx, wx_name)) for attr_name, wx_name in pairs
+        )
+
+        # Kept as plain classes rather than SimpleNamespace instances,
+        # class attribute reads are served by the type attribute cache.
+        value = type(name, (), namespace)
+
+    elif name in _WX_NAMES:
+        import wx
+
+        value = getattr(wx, name)
+
+    else:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        )
+
+    # Cache in the module namespace, later lookups skip __getattr__.
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _CLASS_SPECS.keys() | _WX_NAMES)
 
 
 # Export all style classes for convenient access
@@ -214,8 +212,7 @@ if __name__ == "__main__":
     print("  style = WindowStyle.DEFAULT_FRAME_STYLE | BorderStyle.SUNKEN")
     print("  frame = wx.Frame(None, style=style)")
     print("\nAvailable style classes:")
+    # Counted from the specs, so the classes are not built.
     for cls_name in __all__:
-        cls_obj = globals()[cls_name]
-        attrs = [attr for attr in dir(cls_obj) 
-                if not attr.startswith('_')]
-        print(f"  {cls_name}: {len(attrs)} constants")
+        _, pairs = _CLASS_SPECS[cls_name]
+        print(f"  {cls_name}: {len(pairs)} constants")
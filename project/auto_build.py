@@ -3,17 +3,88 @@
 Automated Build Script for apiwx
 Handles version updates, testing, and package building based on build.json configuration
 """
+import copy
+import functools
 import json
 import os
 import sys
-import subprocess
 import re
+import shlex
 import time
-import shutil
-import glob
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+
+_VERSION_RE = re.compile(rb'version\s*=\s*["\']([^"\']+)["\']')
+_DUNDER_VERSION_RE = re.compile(rb'__version__\s*=\s*["\']([^"\']+)["\']')
+
+# Version declarations usually sit near the top of the file.
+_VERSION_HEAD_SIZE = 4096
+
+
+def _search_version(path: Path, pattern: "re.Pattern[bytes]") -> Optional[str]:
+    """Search a version declaration, reading the file head first.
+
+    The rest of the file is only read when the head has no match.
+    """
+    with open(path, 'rb') as f:
+        content = f.read(_VERSION_HEAD_SIZE)
+        match = pattern.search(content)
+
+        if match is None:
+            content += f.read()
+            match = pattern.search(content)
+
+    if match is None:
+        return None
+
+    return match.group(1).decode('utf-8').strip()
+
+
+@functools.lru_cache(maxsize=8)
+def _read_config_cached(path: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a config file, cached per path and modification time.
+
+    Callers must not mutate the result, BuildAutomation deep-copies it.
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+# Directories never searched for clean targets (VCS, virtualenvs, output).
+_CLEAN_SKIP_DIRS = frozenset({'.git', '.venv', 'venv', 'node_modules', 'dist', 'build'})
+
+
+def _iter_clean_targets(root: str = '.'):
+    """Yield __pycache__ directories and top-level *.egg-info directories.
+
+    Walks the tree once with os.scandir and does not descend into
+    matched directories, since they are removed as a whole, or into
+    _CLEAN_SKIP_DIRS.
+    """
+    stack = [(root, True)]
+
+    while stack:
+        path, is_root = stack.pop()
+
+        try:
+            entries = os.scandir(path)
+        except OSError:
+            continue
+
+        with entries:
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+
+                name = entry.name
+
+                if name == '__pycache__' or (is_root and name.endswith('.egg-info')):
+                    yield entry.path
+                elif name not in _CLEAN_SKIP_DIRS:
+                    stack.append((entry.path, False))
+
+
 class BuildAutomation:
     def __init__(self, config_file: str = "build.json"):
         # If config_file is relative, resolve it relative to this script's directory
@@ -24,13 +95,17 @@ class BuildAutomation:
         self.config_file = config_file
         self.config = self._load_config()
         self.project_root = Path.cwd()
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
 
     def _load_config(self) -> Dict[str, Any]:
         """Load build configuration from JSON file"""
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            # Keyed on mtime, so an edited file is parsed again.
+            mtime_ns = os.stat(self.config_file).st_mtime_ns
+            config = _read_config_cached(self.config_file, mtime_ns)
+
+            # main() and build_quick.py mutate the config per instance.
+            return copy.deepcopy(config)
         except FileNotFoundError:
             print(f"[WARNING] Configuration file '{self.config_file}' not found, using defaults")
             return self._get_default_config()
@@ -95,46 +170,64 @@ class BuildAutomation:
             }
         }
 
-    def _run_command(self, command: str, description: str = None, timeout: int = 60) -> tuple[bool, str]:
-        """Run a shell command and return success status and output"""
+    def _run_command(self, command: str | List[str], description: str = None, timeout: int = 60) -> tuple[bool, str]:
+        """Run a command without a shell and return success status and output
+
+        String commands (e.g. from build.json) are split with shlex on
+        POSIX. On Windows the string is handed to CreateProcess as is,
+        which parses the quoting itself. A leading "python" runs under
+        sys.executable, the interpreter the build checks and installs
+        into.
+        """
         if description:
             print(f">> {description}")
         
+        # Imported here, not every entry point runs commands.
+        import subprocess
+
+        if isinstance(command, str):
+            program, sep, rest = command.lstrip().partition(' ')
+
+            if program == 'python':
+                command = subprocess.list2cmdline([sys.executable]) + sep + rest
+
+        if isinstance(command, str) and os.name != 'nt':
+            args = shlex.split(command)
+        else:
+            args = command
+
         try:
-            process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+            # subprocess.run kills the child and reaps it on timeout.
+            result = subprocess.run(
+                args,
+                shell=False,
+                capture_output=True,
                 text=True,
                 encoding='utf-8',
-                errors='replace'
+                errors='replace',
+                timeout=timeout,
+                check=False
             )
 
-            try:
-                stdout, stderr = process.communicate(timeout=timeout)
-                
-                if process.returncode == 0:
-                    if description:
-                        print(f"[OK] Success: {description}")
-                    return True, stdout
-                else:
-                    if description:
-                        print(f"[ERROR] Failed: {description}")
-                    if stderr:
-                        print(f"Error: {stderr}")
-                    return False, stderr or stdout
-
-            except subprocess.TimeoutExpired:
-                print(f"[TIMEOUT] Command timed out after {timeout}s")
-                process.kill()
-                stdout, stderr = process.communicate()
-                return False, f"Command timed out after {timeout} seconds"
+        except subprocess.TimeoutExpired:
+            print(f"[TIMEOUT] Command timed out after {timeout}s")
+            return False, f"Command timed out after {timeout} seconds"
 
         except Exception as e:
             print(f"[EXCEPTION] {description or command}: {e}")
             return False, str(e)
 
+        if result.returncode == 0:
+            if description:
+                print(f"[OK] Success: {description}")
+            return True, result.stdout
+
+        if description:
+            print(f"[ERROR] Failed: {description}")
+        if result.stderr:
+            print(f"Error: {result.stderr}")
+        return False, result.stderr or result.stdout
+
     def validate_environment(self) -> bool:
         """Validate that all required files exist"""
         print("\n>> Validating Environment...")
@@ -142,12 +235,31 @@ class BuildAutomation:
         validation_config = self.config.get('validation', {})
         required_files = validation_config.get('check_files_exist', [])
         
+        # List each parent directory once instead of a stat per file.
+        # normcase keeps case-insensitive filesystems matching as before.
+        listings: Dict[str, set] = {}
+        missing = []
+
         for file_path in required_files:
-            if not Path(file_path).exists():
-                print(f"[ERROR] Required file missing: {file_path}")
-                return False
-            else:
+            parent, name = os.path.split(os.path.normpath(file_path))
+            existing = listings.get(parent)
+
+            if existing is None:
+                try:
+                    existing = {os.path.normcase(n) for n in os.listdir(parent or '.')}
+                except OSError:
+                    existing = set()
+                listings[parent] = existing
+
+            if os.path.normcase(name) in existing:
                 print(f"[OK] Found: {file_path}")
+            else:
+                missing.append(file_path)
+
+        if missing:
+            for file_path in missing:
+                print(f"[ERROR] Required file missing: {file_path}")
+            return False
 
         print("[OK] Environment validation passed")
         return True
@@ -157,22 +269,16 @@ class BuildAutomation:
         try:
             pyproject_path = Path('pyproject.toml')
             if pyproject_path.exists():
-                with open(pyproject_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-
-                match = re.search(r'version\s*=\s*["\']([^"\']+)["\']', content)
-                if match:
-                    return match.group(1).strip()
+                version = _search_version(pyproject_path, _VERSION_RE)
+                if version:
+                    return version
             
             # Fallback: try to get from __init__.py
             init_path = Path('apiwx/__init__.py')
             if init_path.exists():
-                with open(init_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                match = re.search(r'__version__\s*=\s*["\']([^"\']+)["\']', content)
-                if match:
-                    return match.group(1).strip()
+                version = _search_version(init_path, _DUNDER_VERSION_RE)
+                if version:
+                    return version
             
             return None
         except Exception as e:
@@ -191,34 +297,48 @@ class BuildAutomation:
         print(f"Current version: {current_version}")
         print(f"New version: {new_version}")
 
+        if current_version == new_version:
+            print("[SKIP] Version is already up to date")
+            return True
+
         version_config = self.config.get('version', {})
         files_to_update = version_config.get('files_to_update', [])
 
+        # Group entries by file, so each file is read and written once.
+        groups: Dict[str, List[Dict[str, str]]] = {}
         for file_info in files_to_update:
-            file_path = file_info['file']
-            pattern = file_info['pattern']
-            replacement = file_info['replacement']
+            groups.setdefault(file_info['file'], []).append(file_info)
 
+        for file_path, file_infos in groups.items():
             try:
                 if not Path(file_path).exists():
                     print(f"[WARNING] File not found: {file_path}")
                     continue
 
-                with open(file_path, 'r', encoding='utf-8') as f:
+                # newline='' keeps the file's own line endings.
+                with open(file_path, 'r', encoding='utf-8', newline='') as f:
                     content = f.read()
 
-                old_pattern = pattern.format(old_version=current_version)
-                new_replacement = replacement.format(new_version=new_version)
+                updated = content
 
-                if old_pattern in content:
-                    content = content.replace(old_pattern, new_replacement)
+                for file_info in file_infos:
+                    old_pattern = file_info['pattern'].format(old_version=current_version)
+                    new_replacement = file_info['replacement'].format(new_version=new_version)
 
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        f.write(content)
+                    if old_pattern in updated:
+                        updated = updated.replace(old_pattern, new_replacement)
+                    else:
+                        print(f"[WARNING] Pattern not found in {file_path}: {old_pattern}")
+
+                if updated != content:
+                    # Write a temporary file and swap it in, so an
+                    # interrupted build never leaves a truncated file.
+                    tmp_path = file_path + '.tmp'
+                    with open(tmp_path, 'wb') as f:
+                        f.write(updated.encode('utf-8'))
+                    os.replace(tmp_path, file_path)
 
                     print(f"[OK] Updated {file_path}")
-                else:
-                    print(f"[WARNING] Pattern not found in {file_path}: {old_pattern}")
 
             except Exception as e:
                 print(f"[ERROR] Failed to update {file_path}: {e}")
@@ -282,6 +402,9 @@ class BuildAutomation:
 
         print("\n>> Cleaning Previous Builds...")
 
+        # Imported here, only cleaning removes trees.
+        import shutil
+
         try:
             # Remove common build directories
             for dir_name in ['build', 'dist']:
@@ -289,17 +412,11 @@ class BuildAutomation:
                     shutil.rmtree(dir_name)
                     print(f"[OK] Removed {dir_name} directory")
 
-            # Remove egg-info directories
-            for egg_info in glob.glob('*.egg-info'):
-                if Path(egg_info).exists():
-                    shutil.rmtree(egg_info)
-                    print(f"[OK] Removed {egg_info}")
-
-            # Remove __pycache__ directories
-            for cache_dir in Path('.').rglob('__pycache__'):
+            # Remove egg-info and __pycache__ directories in one walk
+            for target in _iter_clean_targets('.'):
                 try:
-                    shutil.rmtree(cache_dir)
-                    print(f"[OK] Removed {cache_dir}")
+                    shutil.rmtree(target)
+                    print(f"[OK] Removed {target}")
                 except:
                     pass  # Skip if in use
 
@@ -318,14 +435,14 @@ class BuildAutomation:
 
         # Check if build module is available
         success, _ = self._run_command(
-            'python -c "import build"',
+            [sys.executable, '-c', 'import build'],
             "Checking build module availability"
         )
 
         if not success:
             print("[INFO] Installing build module...")
             install_success, _ = self._run_command(
-                'pip install build',
+                [sys.executable, '-m', 'pip', 'install', 'build'],
                 "Installing build module",
                 timeout=120
             )
@@ -349,7 +466,9 @@ class BuildAutomation:
                 print(f"[ERROR] Build failed: {output}")
                 return False
         else:
-            # Build individually
+            # Build individually. At most one of the two is requested
+            # here, and both write build/ and *.egg-info in the source
+            # tree, so they are not run concurrently.
             if create_wheel:
                 wheel_command = commands.get('wheel', 'python -m build --wheel')
                 success, output = self._run_command(
@@ -403,10 +522,25 @@ class BuildAutomation:
         # Verify import
         if post_config.get('verify_import', True):
             project_name = self.config['project']['name']
-            success, output = self._run_command(
-                f'python -c "import sys; sys.path.insert(0, \'.\'); import {project_name}; print(f\'{project_name} imported successfully\')"',
-                "Verifying package import"
-            )
+            print(">> Verifying package import")
+
+            # In-process, saves a second interpreter start-up. The build
+            # process exits right after, so the module is not unloaded.
+            import importlib
+            import importlib.util
+
+            if '.' not in sys.path:
+                sys.path.insert(0, '.')
+
+            try:
+                success = importlib.util.find_spec(project_name) is not None
+                if success:
+                    importlib.import_module(project_name)
+                    print(f"{project_name} imported successfully")
+            except Exception as e:
+                print(f"Error: {e}")
+                success = False
+
             if success:
                 print(f"[OK] Import verification successful")
             else:
@@ -454,7 +588,7 @@ class BuildAutomation:
             return False
 
         # Success!
-        elapsed = time.time() - self.start_time
+        elapsed = (time.perf_counter_ns() - self.start_ns) / 1e9
         print("=" * 60)
         print(f">> Build completed successfully in {elapsed:.2f} seconds!")
         print("=" * 60)
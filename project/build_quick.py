@@ -2,7 +2,15 @@
 """
 Quick Build Helper Script for apiwx
 Simplified interface for common build operations
+
+Usage:
+    python build_quick.py                    # interactive menu
+    python build_quick.py wheel              # build wheel (no tests)
+    python build_quick.py version 0.1.18     # build wheel with new version
+    python build_quick.py full               # build with tests
+    python build_quick.py clean              # clean only
 """
+import argparse
 import sys
 import os
 from pathlib import Path
@@ -12,8 +20,43 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from auto_build import BuildAutomation
 
-def main():
-    """Simple interactive build script"""
+# Interactive menu choices mapped to sub-command names
+MENU_COMMANDS = {
+    "1": "wheel",
+    "2": "version",
+    "3": "full",
+    "4": "clean",
+}
+
+def run(command: str, version: str = None) -> bool:
+    """Run one build operation from the project root"""
+    # Change to project root directory for build operations
+    project_root = Path(__file__).parent.parent
+    os.chdir(project_root)
+    print(f"Changed to project root: {project_root}")
+
+    automation = BuildAutomation()
+
+    if command == "wheel":
+        # Build without tests
+        automation.config['test']['run_tests_before_build'] = False
+        return automation.build()
+
+    if command == "version":
+        # Build with version update
+        automation.config['test']['run_tests_before_build'] = False
+        return automation.build(version)
+
+    if command == "full":
+        # Build with tests
+        return automation.build()
+
+    # Clean only
+    print("Cleaning build artifacts...")
+    return automation.clean_build()
+
+def interactive():
+    """Simple interactive build menu"""
     print("=== apiwx Quick Build Tool ===")
     print("1. Build wheel (no tests)")
     print("2. Build wheel with new version")
@@ -25,50 +68,52 @@ def main():
 
     if choice == "0":
         print("Exiting...")
-        return
+        return None
 
-    # Change to project root directory for build operations
-    project_root = Path(__file__).parent.parent
-    os.chdir(project_root)
-    print(f"Changed to project root: {project_root}")
+    command = MENU_COMMANDS.get(choice)
 
-    automation = BuildAutomation()
+    if command is None:
+        print("Invalid choice!")
+        return None
 
-    if choice == "1":
-        # Build without tests
-        automation.config['test']['run_tests_before_build'] = False
-        success = automation.build()
+    version = None
 
-    elif choice == "2":
-        # Build with version update
+    if command == "version":
         version = input("Enter new version (e.g., 0.1.18): ").strip()
 
         if not version:
             print("No version provided, exiting...")
-            return
-        
-        automation.config['test']['run_tests_before_build'] = False
-        success = automation.build(version)
+            return None
 
-    elif choice == "3":
-        # Build with tests
-        success = automation.build()
+    return run(command, version)
 
-    elif choice == "4":
-        # Clean only
-        print("Cleaning build artifacts...")
-        success = automation.clean_build()
+def main():
+    """Parse sub-commands, or show the interactive menu without one"""
+    parser = argparse.ArgumentParser(description="Quick build helper for apiwx")
+    sub = parser.add_subparsers(dest='command')
+    sub.add_parser('wheel', help='Build wheel (no tests)')
+    version_parser = sub.add_parser('version', help='Build wheel with new version')
+    version_parser.add_argument('version', help='New version to set (e.g., 0.1.18)')
+    sub.add_parser('full', help='Build with tests')
+    sub.add_parser('clean', help='Clean only')
+    sub.add_parser('interactive', help='Show the interactive menu (default)')
 
+    args = parser.parse_args()
+
+    if args.command in (None, 'interactive'):
+        success = interactive()
     else:
-        print("Invalid choice!")
+        success = run(args.command, getattr(args, 'version', None))
+
+    if success is None:
         return
 
     if success:
         print("\n Operation completed successfully!")
-        
+
     else:
         print("\n Operation failed!")
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -5,26 +5,48 @@ Simplified testing framework for core functionality
 """
 import os
 import sys
-from pathlib import Path
+import tempfile
 
 # Setup UTF-8 encoding for Windows
 if os.name == 'nt':
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8")
 
 # Add project to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "apiwx"))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(_HERE)
+sys.path[:0] = [os.path.join(project_root, "apiwx"), project_root]
+
+# Import everything the tests use once. A failure is recorded and
+# re-raised by each test, so every test still reports it.
+try:
+    import apiwx
+    from apiwx import core, debug, mixins_core, mixins_base
+    from apiwx.mixins_base import Singleton, Multiton
+    from apiwx.mixins_core import MixinsType
+    from apiwx.debug import Logger, LogLevel
+
+    # Shared test classes, built once instead of in every test.
+    class _TestClassBase(metaclass=MixinsType):
+        def __init__(self, name="test"):
+            self.name = name
+
+    _SingletonTest = _TestClassBase[Singleton]
+    _MultitonTest = _TestClassBase[Multiton]
+    _IMPORT_ERROR = None
+except Exception as e:
+    _IMPORT_ERROR = e
+
+def _require_imports():
+    """Raise the module-level import failure, if any"""
+    if _IMPORT_ERROR is not None:
+        raise _IMPORT_ERROR
 
 def test_imports():
     """Test basic import functionality"""
     print("Testing imports...")
     try:
-        import apiwx
-        from apiwx import core, debug, mixins_core, mixins_base
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         print("[PASS] Basic imports successful")
         return True
     except Exception as e:
@@ -35,14 +57,11 @@ def test_singleton_basic():
     """Test basic Singleton functionality"""
     print("Testing Singleton pattern...")
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton
+        _require_imports()
 
-        class TestClass(metaclass=MixinsType):
-            def __init__(self, name="test"):
-                self.name = name
-        
-        SingletonTest = TestClass[Singleton]
+        # Start from a fresh instance when the test is run again.
+        _SingletonTest._instance = None
+        SingletonTest = _SingletonTest
         
         obj1 = SingletonTest("first")
         obj2 = SingletonTest("second")
@@ -60,14 +79,9 @@ def test_multiton_basic():
     """Test basic Multiton functionality"""
     print("Testing Multiton pattern...")
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Multiton
-        
-        class TestClass(metaclass=MixinsType):
-            def __init__(self, name="test"):
-                self.name = name
+        _require_imports()
         
-        MultitonTest = TestClass[Multiton]
+        MultitonTest = _MultitonTest
         
         obj1 = MultitonTest("first")
         obj2 = MultitonTest("second")
@@ -86,24 +100,30 @@ def test_debug_system():
     """Test debug system"""
     print("Testing debug system...")
     try:
-        from apiwx import debug
-        from apiwx.debug import Logger, LogLevel
+        _require_imports()
         
         # Test Logger class instantiation
-        logger = Logger(
-            logger_name="TEST_LOGGER",
-            log_dir="./log",
-            log_timestamp="%Y/%m/%d %H:%M:%S",
-            log_tag_length=8,
-            log_maxline=1000,
-            log_maxfiles=5,
-            log_level=LogLevel.DEBUG
-        )
-        
-        # Test logger methods
-        logger.info("TEST", "Test info message")
-        logger.debug("TEST", "Test debug message")
-        logger.warning("TEST", "Test warning message")
+        # Point the logger at a throwaway directory so the test does
+        # not create or append to ./log in the working directory. A
+        # late write by the logger thread must not fail the cleanup.
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as log_dir:
+            logger = Logger(
+                logger_name="TEST_LOGGER",
+                log_dir=log_dir,
+                log_timestamp="%Y/%m/%d %H:%M:%S",
+                log_tag_length=8,
+                log_maxline=1000,
+                log_maxfiles=5,
+                log_level=LogLevel.DEBUG
+            )
+            
+            # Test logger methods
+            logger.info("TEST", "Test info message")
+            logger.debug("TEST", "Test debug message")
+            logger.warning("TEST", "Test warning message")
+            
+            # Drain the writer thread before the directory is removed
+            debug.remain_logger_output(logger)
         
         # Test convenience functions
         debug.uilog("TEST", "UI log test")
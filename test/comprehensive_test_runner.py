@@ -5,105 +5,156 @@ Automatically generated from source code analysis and conversation history
 """
 import sys
 import os
-import importlib
+import functools
+import io
+import tempfile
 import time
-import traceback
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stderr, redirect_stdout
+from types import ModuleType
 from typing import Dict, List, Any, Optional
 
 # Ensure UTF-8 encoding for Windows console
 if os.name == 'nt':  # Windows
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8")
 
 # Add project root to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
-sys.path.insert(0, str(project_root / "apiwx"))
+_HERE = os.path.dirname(os.path.abspath(__file__))
+project_root = os.path.dirname(_HERE)
+sys.path[:0] = [os.path.join(project_root, "apiwx"), project_root]
+
+# APIWX_TEST_QUIET=1 skips printing tracebacks for erroring tests; the
+# error message is still recorded and shown in the summary.
+_QUIET = os.environ.get("APIWX_TEST_QUIET") == "1"
+
+# Import everything the tests use once. A failure is recorded and
+# re-raised by each test, so every test still reports it.
+try:
+    import apiwx
+    from apiwx import debug, core, mixins_core, mixins_base, message, constants
+    from apiwx.fontmanager import FontManager
+    from apiwx.mixins_base import Singleton, Multiton
+    from apiwx.mixins_core import MixinsType, BaseMixins
+    from apiwx.debug import Logger, LogLevel
+
+    # Shared test classes, built once instead of in every test.
+    class _TestClassBase(metaclass=MixinsType):
+        def __init__(self, name="test"):
+            self.name = name
+            self.counter = 0
+
+    _SingletonTest = _TestClassBase[Singleton]
+    _MultitonTest = _TestClassBase[Multiton]
+    _IMPORT_ERROR = None
+except Exception as e:
+    _IMPORT_ERROR = e
+
+def _require_imports():
+    """Raise the module-level import failure, if any"""
+    if _IMPORT_ERROR is not None:
+        raise _IMPORT_ERROR
+
+@functools.lru_cache(maxsize=None)
+def _mro_names(cls):
+    """Class names along cls.__mro__, computed once per class"""
+    return tuple(c.__name__ for c in cls.__mro__)
 
 class TestResult:
-    def __init__(self, name: str, passed: bool, duration: float, error: Optional[str] = None):
+    __slots__ = ("name", "passed", "duration_ns", "error")
+    
+    def __init__(self, name: str, passed: bool, duration_ns: int, error: Optional[str] = None):
         self.name = name
         self.passed = passed
-        self.duration = duration
+        self.duration_ns = duration_ns
         self.error = error
 
 class TestRunner:
     def __init__(self):
         self.results: List[TestResult] = []
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
     
     def run_test(self, test_name: str, test_func) -> bool:
         """Run a single test function"""
-        print(f"\n{'='*60}")
-        print(f"Running: {test_name}")
-        print(f"{'='*60}")
+        # Header in one write, before the test prints anything
+        rule = '=' * 60
+        sys.stdout.write(f"\n{rule}\nRunning: {test_name}\n{rule}\n")
         
-        start = time.time()
+        start = time.perf_counter_ns()
         try:
             result = test_func()
-            duration = time.time() - start
+            duration_ns = time.perf_counter_ns() - start
             
             passed = result if isinstance(result, bool) else True
-            self.results.append(TestResult(test_name, passed, duration))
+            self.results.append(TestResult(test_name, passed, duration_ns))
             
             status = "PASSED" if passed else "FAILED"
-            print(f"Result: {status} ({duration:.2f}s)")
+            sys.stdout.write(f"Result: {status} ({duration_ns / 1e9:.4f}s)\n")
             return passed
             
         except Exception as e:
-            duration = time.time() - start
+            duration_ns = time.perf_counter_ns() - start
             error_msg = str(e)
-            self.results.append(TestResult(test_name, False, duration, error_msg))
+            self.results.append(TestResult(test_name, False, duration_ns, error_msg))
             
-            print(f"Result: ERROR ({duration:.2f}s)")
-            print(f"Error: {error_msg}")
-            print("\nTraceback:")
-            traceback.print_exc()
+            sys.stdout.write(
+                f"Result: ERROR ({duration_ns / 1e9:.4f}s)\n"
+                f"Error: {error_msg}\n"
+            )
+            if not _QUIET:
+                sys.stdout.write("\nTraceback:\n")
+                sys.stdout.flush()
+                import traceback
+                traceback.print_exc()
             return False
     
     def print_summary(self):
         """Print test results summary"""
-        total_time = time.time() - self.start_time
-        
-        print(f"\n{'='*80}")
-        print("TEST SUMMARY")
-        print(f"{'='*80}")
+        total_time = (time.perf_counter_ns() - self.start_ns) / 1e9
         
         total_tests = len(self.results)
         passed_tests = sum(1 for r in self.results if r.passed)
         failed_tests = total_tests - passed_tests
         
-        print(f"Total tests: {total_tests}")
-        print(f"Passed: {passed_tests}")
-        print(f"Failed: {failed_tests}")
-        print(f"Success rate: {passed_tests/total_tests*100:.1f}%" if total_tests > 0 else "No tests run")
-        print(f"Total time: {total_time:.2f}s")
+        # Build the whole summary and emit it in one write
+        lines = [
+            "",
+            "=" * 80,
+            "TEST SUMMARY",
+            "=" * 80,
+            f"Total tests: {total_tests}",
+            f"Passed: {passed_tests}",
+            f"Failed: {failed_tests}",
+            f"Success rate: {passed_tests/total_tests*100:.1f}%" if total_tests > 0 else "No tests run",
+            f"Total time: {total_time:.2f}s",
+        ]
         
         if self.results:
-            print(f"\nDetailed Results:")
-            for result in self.results:
-                status = "[PASS]" if result.passed else "[FAIL]"
-                time_str = f"{result.duration:.2f}s"
-                error_str = f" - {result.error}" if result.error else ""
-                print(f"  {result.name:<30} {status} {time_str}{error_str}")
+            lines.append("\nDetailed Results:")
+            lines.extend(_format_result(result) for result in self.results)
         
         if failed_tests == 0:
-            print(f"\nAll tests passed! The apiwx project is working correctly.")
+            lines.append("\nAll tests passed! The apiwx project is working correctly.")
         else:
-            print(f"\n{failed_tests} test(s) failed. Please check the output above.")
+            lines.append(f"\n{failed_tests} test(s) failed. Please check the output above.")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return passed_tests == total_tests
 
+def _format_result(result: TestResult) -> str:
+    """Format one summary table row"""
+    status = "[PASS]" if result.passed else "[FAIL]"
+    time_str = f"{result.duration_ns / 1e9:.4f}s"
+    error_str = f" - {result.error}" if result.error else ""
+    return f"  {result.name:<30} {status} {time_str}{error_str}"
+
 # Test Functions
 def test_basic_imports():
     """Test basic module imports"""
     try:
-        import apiwx
-        from apiwx import debug, core, mixins_core, mixins_base
-        from apiwx.mixins_base import Singleton, Multiton
-        from apiwx.mixins_core import MixinsType, BaseMixins
+        _require_imports()
         print("Basic imports successful")
         return True
     except Exception as e:
@@ -113,25 +164,31 @@ def test_basic_imports():
 def test_debug_system():
     """Test debug and logging system"""
     try:
-        from apiwx import debug
-        from apiwx.debug import Logger, LogLevel
+        _require_imports()
         
         # Test Logger class creation
-        logger = Logger(
-            logger_name="TEST_LOGGER",
-            log_dir="./log",
-            log_timestamp="%Y/%m/%d %H:%M:%S",
-            log_tag_length=8,
-            log_maxline=1000,
-            log_maxfiles=5,
-            log_level=LogLevel.DEBUG
-        )
-        
-        # Test log levels
-        logger.debug("TEST", "Debug message")
-        logger.info("TEST", "Info message")
-        logger.warning("TEST", "Warning message")
-        logger.error("TEST", "Error message")
+        # Point the logger at a throwaway directory so the test does
+        # not create or append to ./log in the working directory. A
+        # late write by the logger thread must not fail the cleanup.
+        with tempfile.TemporaryDirectory(ignore_cleanup_errors=True) as log_dir:
+            logger = Logger(
+                logger_name="TEST_LOGGER",
+                log_dir=log_dir,
+                log_timestamp="%Y/%m/%d %H:%M:%S",
+                log_tag_length=8,
+                log_maxline=1000,
+                log_maxfiles=5,
+                log_level=LogLevel.DEBUG
+            )
+            
+            # Test log levels
+            logger.debug("TEST", "Debug message")
+            logger.info("TEST", "Info message")
+            logger.warning("TEST", "Warning message")
+            logger.error("TEST", "Error message")
+            
+            # Drain the writer thread before the directory is removed
+            debug.remain_logger_output(logger)
         
         # Test internal logging
         debug.internallog("TEST", "Internal log message")
@@ -145,15 +202,11 @@ def test_debug_system():
 def test_singleton_pattern():
     """Test Singleton pattern implementation"""
     try:
-        from apiwx.mixins_base import Singleton
-        from apiwx.mixins_core import MixinsType
-        
-        class TestClass(metaclass=MixinsType):
-            def __init__(self, name="test"):
-                self.name = name
-                self.counter = 0
+        _require_imports()
         
-        SingletonTest = TestClass[Singleton]
+        # Start from a fresh instance when the test is run again.
+        _SingletonTest._instance = None
+        SingletonTest = _SingletonTest
         
         # Test singleton behavior
         obj1 = SingletonTest("first")
@@ -184,15 +237,9 @@ def test_singleton_pattern():
 def test_multiton_pattern():
     """Test Multiton pattern implementation"""
     try:
-        from apiwx.mixins_base import Multiton
-        from apiwx.mixins_core import MixinsType
-        
-        class TestClass(metaclass=MixinsType):
-            def __init__(self, name="test"):
-                self.name = name
-                self.counter = 0
+        _require_imports()
         
-        MultitonTest = TestClass[Multiton]
+        MultitonTest = _MultitonTest
         
         # Test multiton behavior
         obj1 = MultitonTest("first")
@@ -227,31 +274,26 @@ def test_multiton_pattern():
 def test_mixins_system():
     """Test core generics system"""
     try:
-        from apiwx.mixins_core import MixinsType, BaseGenerics
-        from apiwx.mixins_base import Singleton, Multiton
-        
-        class TestBase(metaclass=MixinsType):
-            def __init__(self, value=42):
-                self.value = value
+        _require_imports()
+        from apiwx.mixins_core import BaseGenerics
         
         # Test generic class creation
-        SingletonClass = TestBase[Singleton]
-        MultitonClass = TestBase[Multiton]
+        SingletonClass = _SingletonTest
+        MultitonClass = _MultitonTest
         
         # Test MRO structure
-        singleton_mro = [cls.__name__ for cls in SingletonClass.__mro__]
-        multiton_mro = [cls.__name__ for cls in MultitonClass.__mro__]
-        
-        print(f"Singleton MRO: {singleton_mro}")
-        print(f"Multiton MRO: {multiton_mro}")
+        print(f"Singleton MRO: {list(_mro_names(SingletonClass))}")
+        print(f"Multiton MRO: {list(_mro_names(MultitonClass))}")
         
         # Test metaclass replacement
-        if type(SingletonClass).__name__ != "Singleton":
-            print(f"Generics test failed: Expected Singleton metaclass, got {type(SingletonClass).__name__}")
+        singleton_meta = type(SingletonClass).__name__
+        if singleton_meta != "Singleton":
+            print(f"Generics test failed: Expected Singleton metaclass, got {singleton_meta}")
             return False
         
-        if type(MultitonClass).__name__ != "Multiton":
-            print(f"Generics test failed: Expected Multiton metaclass, got {type(MultitonClass).__name__}")
+        multiton_meta = type(MultitonClass).__name__
+        if multiton_meta != "Multiton":
+            print(f"Generics test failed: Expected Multiton metaclass, got {multiton_meta}")
             return False
         
         print("Generics system working correctly")
@@ -263,7 +305,7 @@ def test_mixins_system():
 def test_core_components():
     """Test core apiwx components"""
     try:
-        from apiwx import core
+        _require_imports()
         
         # Test that core classes are importable
         components = ['App', 'Window', 'Panel']
@@ -281,7 +323,7 @@ def test_core_components():
 def test_message_system():
     """Test message box system"""
     try:
-        from apiwx import message
+        _require_imports()
         
         # Test message types and enums
         required_items = ['MessageType', 'MessageResult', 'MessageBox']
@@ -305,7 +347,7 @@ def test_message_system():
 def test_constants_and_enums():
     """Test constants and enumerations"""
     try:
-        from apiwx import constants
+        _require_imports()
         
         # Test that constants module is importable
         print("Constants module imported successfully")
@@ -317,8 +359,7 @@ def test_constants_and_enums():
 def test_mixins_integration():
     """Test advanced generics integration"""
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         
         # Test inheritance with generics
         class BaseClass:
@@ -371,8 +412,7 @@ def test_mixins_integration():
 def test_error_handling():
     """Test error handling and edge cases"""
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton
+        _require_imports()
         
         # Test empty class with generics
         class EmptyClass(metaclass=MixinsType):
@@ -392,38 +432,86 @@ def test_error_handling():
         print(f"Error handling test failed: {e}")
         return False
 
+def test_font_key_validation():
+    """Test that malformed font key names are rejected"""
+    try:
+        _require_imports()
+        
+        manager = FontManager()
+        
+        # Six fields, int() would accept the merged "1_1" tail
+        for keyname in ("12_400_0_0_1_1", "12_400_0_0", "12_bold_0_0_0"):
+            try:
+                manager.create_by_keyname(keyname)
+            except ValueError:
+                continue
+            
+            print(f"Font key test failed: '{keyname}' was accepted")
+            return False
+        
+        print("Malformed font key names rejected")
+        return True
+    except Exception as e:
+        print(f"Font key test failed: {e}")
+        return False
+
+# auto_build.py loaded by test_auto_build_compatibility, kept so reruns
+# in the same process do not execute the script again
+_AUTO_BUILD_MOD: Optional[ModuleType] = None
+
 def test_auto_build_compatibility():
     """Test compatibility with auto_build.py"""
+    global _AUTO_BUILD_MOD
+    import importlib.util
+
     try:
         # Import auto_build module
-        auto_build_path = project_root / "project" / "auto_build.py"
-        if auto_build_path.exists():
+        if _AUTO_BUILD_MOD is None:
+            auto_build_path = os.path.join(project_root, "project", "auto_build.py")
+            if not os.path.exists(auto_build_path):
+                print("auto_build.py not found, skipping compatibility test")
+                return True
+            
             spec = importlib.util.spec_from_file_location("auto_build", auto_build_path)
-            auto_build = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(auto_build)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            _AUTO_BUILD_MOD = module
+        
+        auto_build = _AUTO_BUILD_MOD
+        
+        # Test BuildAutomation class
+        if hasattr(auto_build, 'BuildAutomation'):
+            # Test basic instantiation
+            build_automation = auto_build.BuildAutomation("project/build.json")
             
-            # Test BuildAutomation class
-            if hasattr(auto_build, 'BuildAutomation'):
-                # Test basic instantiation
-                build_automation = auto_build.BuildAutomation("project/build.json")
-                
-                # Test that config is loaded
-                if hasattr(build_automation, 'config') and build_automation.config:
-                    print("auto_build.py compatibility verified")
-                    return True
-                else:
-                    print("auto_build.py config loading failed")
-                    return False
+            # Test that config is loaded
+            if hasattr(build_automation, 'config') and build_automation.config:
+                print("auto_build.py compatibility verified")
+                return True
             else:
-                print("auto_build.py missing BuildAutomation class")
+                print("auto_build.py config loading failed")
                 return False
         else:
-            print("auto_build.py not found, skipping compatibility test")
-            return True
+            print("auto_build.py missing BuildAutomation class")
+            return False
     except Exception as e:
         print(f"auto_build compatibility test failed: {e}")
         return False
 
+def _run_one(test_name: str, test_func):
+    """Run one test in a worker process.
+
+    Output is captured so the parent can print each test's block in
+    suite order. Module-level, so it can be pickled for the pool.
+    """
+    runner = TestRunner()
+    buf = io.StringIO()
+
+    with redirect_stdout(buf), redirect_stderr(buf):
+        runner.run_test(test_name, test_func)
+
+    return runner.results[0], buf.getvalue()
+
 def run_all_tests():
     """Run the complete test suite"""
     runner = TestRunner()
@@ -447,45 +535,67 @@ def run_all_tests():
         ("Constants and Enums", test_constants_and_enums),
         ("Generics Integration", test_mixins_integration),
         ("Error Handling", test_error_handling),
+        ("Font Key Validation", test_font_key_validation),
         ("Auto-Build Compatibility", test_auto_build_compatibility),
     ]
     
-    # Run all tests
-    for test_name, test_func in test_functions:
-        runner.run_test(test_name, test_func)
+    # Run all tests. Tests are independent, so they run in worker
+    # processes; results are reported in suite order.
+    try:
+        with ProcessPoolExecutor(max_workers=min(len(test_functions), os.cpu_count() or 1)) as executor:
+            futures = [
+                executor.submit(_run_one, test_name, test_func)
+                for test_name, test_func in test_functions
+            ]
+
+            for future in futures:
+                result, output = future.result()
+                sys.stdout.write(output)
+                runner.results.append(result)
+
+    except (OSError, NotImplementedError, BrokenProcessPool) as e:
+        # No process support (e.g. restricted sandbox) or a worker died,
+        # run serially.
+        print(f"Parallel run unavailable ({e}), running tests serially")
+        runner.results.clear()
+
+        for test_name, test_func in test_functions:
+            runner.run_test(test_name, test_func)
     
     # Print summary and return result
     return runner.print_summary()
 
+# Short test names for run_specific_test
+_TEST_MAP: Dict[str, Any] = {
+    "imports": test_basic_imports,
+    "debug": test_debug_system,
+    "singleton": test_singleton_pattern,
+    "multiton": test_multiton_pattern,
+    "generics": test_mixins_system,
+    "core": test_core_components,
+    "message": test_message_system,
+    "constants": test_constants_and_enums,
+    "integration": test_mixins_integration,
+    "errors": test_error_handling,
+    "fontkeys": test_font_key_validation,
+    "autobuild": test_auto_build_compatibility,
+}
+
 def run_specific_test(test_name: str):
     """Run a specific test by name"""
-    test_map = {
-        "imports": test_basic_imports,
-        "debug": test_debug_system,
-        "singleton": test_singleton_pattern,
-        "multiton": test_multiton_pattern,
-        "generics": test_mixins_system,
-        "core": test_core_components,
-        "message": test_message_system,
-        "constants": test_constants_and_enums,
-        "integration": test_mixins_integration,
-        "errors": test_error_handling,
-        "autobuild": test_auto_build_compatibility,
-    }
-    
-    if test_name in test_map:
+    test_func = _TEST_MAP.get(test_name)
+
+    if test_func is not None:
         runner = TestRunner()
-        result = runner.run_test(test_name.title(), test_map[test_name])
+        result = runner.run_test(test_name.title(), test_func)
         runner.print_summary()
         return result
     else:
         print(f"Unknown test: {test_name}")
-        print(f"Available tests: {', '.join(test_map.keys())}")
+        print(f"Available tests: {', '.join(_TEST_MAP.keys())}")
         return False
 
 if __name__ == "__main__":
-    import importlib.util
-    
     if len(sys.argv) > 1:
         # Run specific test
         test_name = sys.argv[1].lower()
@@ -27,16 +27,20 @@ def debug_get_all_members():
     # Test get_all_members on the class
     print("Before instance creation:")
     
+    # Collect each MRO entry's non-dunder attributes once and reuse them below
+    mro_info = [
+        (i, cls, {k: v for k, v in vars(cls).items() if not k.startswith('__')})
+        for i, cls in enumerate(TestApp.__mro__)
+    ]
+    
     # Check each step of MRO processing
     print(f"\nMRO debug:")
-    for i, cls in enumerate(TestApp.__mro__):
+    for i, cls, attrs in mro_info:
         print(f"  {i}: {cls}")
-        if hasattr(cls, '__dict__'):
-            attrs = {k: v for k, v in cls.__dict__.items() if not k.startswith('__')}
-            if attrs:
-                print(f"    Local attrs: {list(attrs.keys())}")
-                if 'main_panel' in attrs:
-                    print(f"      main_panel found here: {attrs['main_panel']}")
+        if attrs:
+            print(f"    Local attrs: {list(attrs.keys())}")
+            if 'main_panel' in attrs:
+                print(f"      main_panel found here: {attrs['main_panel']}")
     
     members = TestApp.get_all_members()
     print(f"\nAll members found ({len(members)}):")
@@ -53,18 +57,15 @@ def debug_get_all_members():
         
     # Check class __dict__ directly
     print(f"\nTestApp.__dict__:")
-    for name, value in TestApp.__dict__.items():
-        if not name.startswith('__'):
-            print(f"  {name}: {value}")
+    for name, value in mro_info[0][2].items():
+        print(f"  {name}: {value}")
     
     # Check MRO
     print(f"\nTestApp.__mro__:")
-    for i, cls in enumerate(TestApp.__mro__):
+    for i, cls, attrs in mro_info:
         print(f"  {i}: {cls}")
-        if hasattr(cls, '__dict__'):
-            relevant_attrs = {k: v for k, v in cls.__dict__.items() if not k.startswith('__')}
-            if relevant_attrs:
-                print(f"    Attributes: {list(relevant_attrs.keys())}")
+        if attrs:
+            print(f"    Attributes: {list(attrs.keys())}")
     
     print("Creating TestApp instance...")
     try:
@@ -9,23 +9,35 @@ from pathlib import Path
 
 # Setup UTF-8 encoding for Windows
 if os.name == 'nt':
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8")
 
 # Add project to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "apiwx"))
 
+# Import everything the tests use once. A failure is recorded and
+# re-raised by each test, so every test still reports it.
+try:
+    from apiwx import core, debug, message
+    from apiwx.mixins_core import MixinsType
+    from apiwx.mixins_base import Singleton, Multiton
+    _IMPORT_ERROR = None
+except Exception as e:
+    _IMPORT_ERROR = e
+
+def _require_imports():
+    """Raise the module-level import failure, if any"""
+    if _IMPORT_ERROR is not None:
+        raise _IMPORT_ERROR
+
 def test_debug_with_patterns():
     """Test debug system with singleton/multiton patterns"""
     print("Testing debug system with patterns...")
     
     try:
-        from apiwx import debug
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         
         class LoggedClass(metaclass=MixinsType):
             def __init__(self, name):
@@ -73,7 +85,7 @@ def test_message_system_availability():
     print("Testing message system availability...")
     
     try:
-        from apiwx import message
+        _require_imports()
         
         # Check message types exist
         assert hasattr(message, 'MessageType'), "MessageType not found"
@@ -96,7 +108,7 @@ def test_core_component_availability():
     print("Testing core component availability...")
     
     try:
-        from apiwx import core
+        _require_imports()
         
         # Check core classes exist
         core_classes = ['App', 'Window', 'Panel']
@@ -115,8 +127,7 @@ def test_mixins_with_inheritance():
     print("Testing generics with inheritance...")
     
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         
         class BaseComponent:
             def __init__(self, name):
@@ -167,8 +178,7 @@ def test_mixed_pattern_usage():
     print("Testing mixed pattern usage...")
     
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         
         class SharedBase(metaclass=MixinsType):
             instances_created = 0
@@ -221,8 +231,8 @@ def test_mixins_system_integrity():
     print("Testing generics system integrity...")
     
     try:
-        from apiwx.mixins_core import MixinsType, BaseGenerics
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
+        from apiwx.mixins_core import BaseGenerics
         
         # Test BaseGenerics is properly configured as a metaclass
         assert issubclass(BaseGenerics, type), "BaseGenerics should be a metaclass type"
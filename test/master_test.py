@@ -1,60 +1,98 @@
+import argparse
+import importlib
+import io
 import os
 import sys
 import subprocess
+from contextlib import redirect_stderr, redirect_stdout
+
+_TEST_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Test modules and the entry point each one calls from its __main__ block
+TESTS = [
+    ("quick_test", "quick_test"),
+    ("basic_test_runner", "run_basic_tests"),
+    ("pattern_tests", "run_pattern_tests"),
+    ("integration_tests", "run_integration_tests"),
+    ("comprehensive_test_runner", "run_all_tests"),
+]
+
+def run_test_isolated(test_file):
+    result = subprocess.run([sys.executable, os.path.join(_TEST_DIR, test_file)],
+                          capture_output=True, text=True, encoding='utf-8')
+
+    print(result.stdout)
+    if result.stderr:
+        print("STDERR:", result.stderr)
+
+    return result.returncode == 0
+
+def run_test_in_process(module_name, entry):
+    # Import outside the redirect so module-level setup sees the real streams
+    module = importlib.import_module(module_name)
+
+    out, err = io.StringIO(), io.StringIO()
+    try:
+        with redirect_stdout(out), redirect_stderr(err):
+            success = bool(getattr(module, entry)())
+    finally:
+        print(out.getvalue())
+        if err.getvalue():
+            print("STDERR:", err.getvalue())
+
+    return success
+
+def run_test(module_name, entry, isolated=False):
+    test_file = f"{module_name}.py"
 
-def run_test(test_file):
     print(f"\n{'='*50}")
     print(f"Running: {test_file}")
     print(f"{'='*50}")
-    
+
     try:
-        result = subprocess.run([sys.executable, f"test/{test_file}"], 
-                              capture_output=True, text=True, encoding='utf-8')
-        
-        print(result.stdout)
-        if result.stderr:
-            print("STDERR:", result.stderr)
-        
-        success = result.returncode == 0
+        if isolated:
+            success = run_test_isolated(test_file)
+        else:
+            success = run_test_in_process(module_name, entry)
+
         status = "PASS" if success else "FAIL"
         print(f"[{status}] {test_file}")
         return success
-        
+
     except Exception as e:
         print(f"[ERROR] {test_file}: {e}")
         return False
 
 def main():
+    parser = argparse.ArgumentParser(description="apiwx master test runner")
+    parser.add_argument('--isolated', action='store_true',
+                        help='Run each test file in its own Python process')
+    args = parser.parse_args()
+
     print("apiwx Master Test Runner")
     print("=" * 50)
-    
-    tests = [
-        "quick_test.py",
-        "basic_test_runner.py",
-        "pattern_tests.py", 
-        "integration_tests.py",
-        "comprehensive_test_runner.py",
-        "test_mixins_core_changes.py"
-    ]
-    
+
+    if not args.isolated and _TEST_DIR not in sys.path:
+        sys.path.insert(0, _TEST_DIR)
+
     passed = 0
     total = 0
-    
-    for test in tests:
-        if os.path.exists(f"test/{test}"):
+
+    for module_name, entry in TESTS:
+        if os.path.exists(os.path.join(_TEST_DIR, f"{module_name}.py")):
             total += 1
-            if run_test(test):
+            if run_test(module_name, entry, args.isolated):
                 passed += 1
         else:
-            print(f"[SKIP] {test} (not found)")
-    
+            print(f"[SKIP] {module_name}.py (not found)")
+
     print(f"\n{'='*50}")
     print(f"SUMMARY: {passed}/{total} tests passed")
     print(f"{'='*50}")
-    
+
     return passed == total and total > 0
 
 if __name__ == "__main__":
     success = main()
     print(f"\nOverall result: {'SUCCESS' if success else 'FAILURE'}")
-    sys.exit(0 if success else 1)
\ No newline at end of file
+    sys.exit(0 if success else 1)
@@ -9,23 +9,35 @@ from pathlib import Path
 
 # Setup UTF-8 encoding for Windows
 if os.name == 'nt':
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8")
 
 # Add project to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "apiwx"))
 
+# Import everything the tests use once. A failure is recorded and
+# re-raised by each test, so every test still reports it.
+try:
+    from apiwx.mixins_core import MixinsType
+    from apiwx.mixins_base import Singleton, Multiton
+    _IMPORT_ERROR = None
+except Exception as e:
+    _IMPORT_ERROR = e
+
+def _require_imports():
+    """Raise the module-level import failure, if any"""
+    if _IMPORT_ERROR is not None:
+        raise _IMPORT_ERROR
+
 def test_singleton_detailed():
     """Detailed Singleton pattern testing"""
     print("Detailed Singleton Pattern Test")
     print("-" * 40)
     
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton
+        _require_imports()
         
         class Counter(metaclass=MixinsType):
             def __init__(self, start=0):
@@ -74,8 +86,7 @@ def test_multiton_detailed():
     print("-" * 40)
     
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Multiton
+        _require_imports()
         
         class NamedCounter(metaclass=MixinsType):
             def __init__(self, name, start=0):
@@ -138,8 +149,7 @@ def test_metaclass_behavior():
     print("-" * 40)
     
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         
         class BaseClass(metaclass=MixinsType):
             def __init__(self, value):
@@ -187,8 +197,7 @@ def test_edge_cases():
     print("-" * 40)
     
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         
         # Test with no-argument constructor
         class SimpleClass(metaclass=MixinsType):
@@ -9,15 +9,28 @@ from pathlib import Path
 
 # Setup UTF-8 encoding for Windows
 if os.name == 'nt':
-    import codecs
-    sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
-    sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
+    sys.stdout.reconfigure(encoding="utf-8")
+    sys.stderr.reconfigure(encoding="utf-8")
 
 # Add project to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 sys.path.insert(0, str(project_root / "apiwx"))
 
+# Import everything the test uses once. A failure is recorded and
+# re-raised by the import check below.
+try:
+    from apiwx.mixins_core import MixinsType
+    from apiwx.mixins_base import Singleton, Multiton
+    _IMPORT_ERROR = None
+except Exception as e:
+    _IMPORT_ERROR = e
+
+def _require_imports():
+    """Raise the module-level import failure, if any"""
+    if _IMPORT_ERROR is not None:
+        raise _IMPORT_ERROR
+
 def quick_test():
     """Quick verification of core functionality"""
     print("Quick Test: Singleton and Multiton Core Functionality")
@@ -26,8 +39,7 @@ def quick_test():
     # Test 1: Basic imports
     print("1. Testing imports...")
     try:
-        from apiwx.mixins_core import MixinsType
-        from apiwx.mixins_base import Singleton, Multiton
+        _require_imports()
         print("   [PASS] Imports successful")
     except Exception as e:
         print(f"   [FAIL] Import error: {e}")